@@ -35,11 +35,17 @@ def main(ctx, verbose):
     "--language", "-l",
     help="Output language (overrides config)"
 )
+@click.option(
+    "--no-cache", is_flag=True,
+    help="Ignore cached responses and always call the LLM API"
+)
 @click.pass_context
-def commit(ctx, apply, model, language):
+def commit(ctx, apply, model, language, no_cache):
     """Generate AI-powered commit message from staged changes."""
     verbose = ctx.obj.get('verbose', False) if ctx.obj else False
-    execute_commit(apply=apply, model=model, language=language, verbose=verbose)
+    execute_commit(
+        apply=apply, model=model, language=language, no_cache=no_cache, verbose=verbose
+    )
 
 
 @main.command()
@@ -59,11 +65,22 @@ def commit(ctx, apply, model, language):
     "--force", "-f", is_flag=True,
     help="Force overwrite existing output file"
 )
+@click.option(
+    "--batch", is_flag=True,
+    help="Use the OpenAI Batch API (cheaper, may take up to 24 hours)"
+)
+@click.option(
+    "--no-cache", is_flag=True,
+    help="Ignore cached responses and always call the LLM API"
+)
 @click.pass_context
-def changelog(ctx, from_ref, to_ref, output, force):
+def changelog(ctx, from_ref, to_ref, output, force, batch, no_cache):
     """Generate changelog from git history."""
     verbose = ctx.obj.get('verbose', False) if ctx.obj else False
-    execute_changelog(from_ref=from_ref, to_ref=to_ref, output=output, force=force, verbose=verbose)
+    execute_changelog(
+        from_ref=from_ref, to_ref=to_ref, output=output, force=force,
+        batch=batch, no_cache=no_cache, verbose=verbose
+    )
 
 
 @main.group()
@@ -121,6 +138,9 @@ def get(key):
                 for key, value in config.llm.azure_openai.items():
                     click.echo(f"    {key} = {value}")
 
+            if config.llm.cache_ttl:
+                click.echo(f"  llm.cache_ttl = {config.llm.cache_ttl}")
+
             click.echo(f"  jira.enabled = {config.jira.enabled}")
             if config.jira.branch_regex:
                 click.echo(f"  jira.branch_regex = {config.jira.branch_regex}")
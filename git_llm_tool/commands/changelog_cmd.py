@@ -8,7 +8,7 @@ from typing import Optional
 from git_llm_tool.core.config import get_config
 from git_llm_tool.core.git_helper import GitHelper
 from git_llm_tool.core.exceptions import GitError, ApiError, ConfigError
-from git_llm_tool.providers import get_provider
+from git_llm_tool.providers import get_provider, OpenAiProvider
 
 
 def _manage_changelog_file(new_content: str, verbose: bool = False) -> str:
@@ -93,6 +93,8 @@ def execute_changelog(
     to_ref: str = "HEAD",
     output: Optional[str] = None,
     force: bool = False,
+    batch: bool = False,
+    no_cache: bool = False,
     verbose: bool = False
 ) -> None:
     """Execute the changelog command logic.
@@ -102,12 +104,18 @@ def execute_changelog(
         to_ref: Ending reference (default: HEAD)
         output: Output file path
         force: Force overwrite existing file
+        batch: Use the OpenAI Batch API instead of synchronous calls
+        no_cache: Bypass the response cache
         verbose: Enable verbose output
     """
     try:
         # Load configuration
         config = get_config()
 
+        # Override config with CLI parameters
+        if no_cache:
+            config.llm.cache_ttl = 0
+
         if verbose:
             click.echo(f"📄 Using model: {config.llm.default_model}")
             click.echo(f"🌐 Using language: {config.llm.language}")
@@ -137,11 +145,19 @@ def execute_changelog(
             click.echo(f"❌ {e}", err=True)
             return
 
+        if batch and not isinstance(provider, OpenAiProvider):
+            click.echo("❌ Batch mode is only supported with OpenAI models", err=True)
+            return
+
         # Generate changelog
         click.echo("🤖 Generating changelog...")
 
         try:
-            changelog = provider.generate_changelog(commit_messages)
+            if batch:
+                click.echo("⏳ Waiting for OpenAI batch to complete (this can take up to 24 hours)...")
+                changelog = provider.generate_changelog_batch(commit_messages)
+            else:
+                changelog = provider.generate_changelog(commit_messages)
         except ApiError as e:
             click.echo(f"❌ API Error: {e}", err=True)
             return
@@ -14,6 +14,7 @@ def execute_commit(
     apply: bool = False,
     model: Optional[str] = None,
     language: Optional[str] = None,
+    no_cache: bool = False,
     verbose: bool = False
 ) -> None:
     """Execute the commit command logic.
@@ -22,6 +23,7 @@ def execute_commit(
         apply: Whether to apply commit directly without editor
         model: Override model from config
         language: Override language from config
+        no_cache: Bypass the response cache
         verbose: Enable verbose output
     """
     try:
@@ -33,6 +35,8 @@ def execute_commit(
             config.llm.default_model = model
         if language:
             config.llm.language = language
+        if no_cache:
+            config.llm.cache_ttl = 0
 
         if verbose:
             click.echo(f"📄 Using model: {config.llm.default_model}")
@@ -88,13 +92,21 @@ def execute_commit(
             commit_message = provider.generate_commit_message(
                 diff=diff,
                 jira_ticket=jira_ticket,
-                work_hours=work_hours
+                work_hours=work_hours,
+                stream=True
             )
         except ApiError as e:
             click.echo(f"❌ API Error: {e}", err=True)
             return
 
-        if verbose:
+        if provider.last_diff_truncated:
+            click.echo(
+                "⚠️  Diff truncated to fit model context; the message may miss some changes",
+                err=True
+            )
+
+        # Streamed responses were already echoed as they arrived
+        if not provider.last_response_streamed:
             click.echo(f"✨ Generated message: {commit_message}")
 
         # Apply commit or open editor
@@ -103,7 +115,6 @@ def execute_commit(
             try:
                 git_helper.commit_with_message(commit_message)
                 click.echo("✅ Commit applied successfully!")
-                click.echo(f"📝 Message: {commit_message}")
             except GitError as e:
                 click.echo(f"❌ Commit failed: {e}", err=True)
         else:
@@ -1,5 +1,7 @@
 """Configuration management for git-llm-tool."""
 
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
@@ -8,30 +10,45 @@ from dataclasses import dataclass, field
 
 from git_llm_tool.core.exceptions import ConfigError
 
+# Prefer the libyaml C backend when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
-@dataclass
+
+@functools.lru_cache(maxsize=4)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file, memoized on its path, modification time and size."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+        return data if data is not None else {}
+
+
+@dataclass(slots=True)
 class LlmConfig:
     """LLM configuration settings."""
     default_model: str = "gpt-4o"
     language: str = "en"
     api_keys: Dict[str, str] = field(default_factory=dict)
     azure_openai: Dict[str, str] = field(default_factory=dict)  # endpoint, api_version, deployment_name
+    cache_ttl: int = 0  # seconds to reuse cached responses; 0 disables the cache
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraConfig:
     """Jira integration configuration."""
     enabled: bool = False
     ticket_pattern: Optional[str] = None  # Jira ticket regex pattern
 
 
-@dataclass
+@dataclass(slots=True)
 class EditorConfig:
     """Editor configuration settings."""
     preferred_editor: Optional[str] = None  # e.g., "vi", "nano", "code", etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Main application configuration."""
     llm: LlmConfig = field(default_factory=LlmConfig)
@@ -85,9 +102,10 @@ class ConfigLoader:
     def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
         """Load YAML configuration file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                return data if data is not None else {}
+            stat = os.stat(file_path)
+            data = _parse_yaml_file(str(file_path), stat.st_mtime_ns, stat.st_size)
+            # Callers mutate the result, so never hand out the cached dict
+            return copy.deepcopy(data)
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML in {file_path}: {e}")
         except Exception as e:
@@ -150,11 +168,18 @@ class ConfigLoader:
         """Create AppConfig instance from configuration data."""
         # Create LLM config
         llm_data = config_data.get("llm", {})
+        cache_ttl = llm_data.get("cache_ttl", 0)
+        try:
+            cache_ttl = int(cache_ttl)
+        except (TypeError, ValueError):
+            raise ConfigError(f"Invalid cache TTL (expected seconds): {cache_ttl}")
+
         llm_config = LlmConfig(
             default_model=llm_data.get("default_model", "gpt-4o"),
             language=llm_data.get("language", "en"),
             api_keys=llm_data.get("api_keys", {}),
-            azure_openai=llm_data.get("azure_openai", {})
+            azure_openai=llm_data.get("azure_openai", {}),
+            cache_ttl=cache_ttl
         )
 
         # Create Jira config
@@ -187,7 +212,8 @@ class ConfigLoader:
                 "default_model": self._config.llm.default_model,
                 "language": self._config.llm.language,
                 "api_keys": self._config.llm.api_keys,
-                "azure_openai": self._config.llm.azure_openai
+                "azure_openai": self._config.llm.azure_openai,
+                "cache_ttl": self._config.llm.cache_ttl
             },
             "jira": {
                 "enabled": self._config.jira.enabled,
@@ -203,6 +229,8 @@ class ConfigLoader:
             del config_dict["llm"]["api_keys"]
         if not config_dict["llm"]["azure_openai"]:
             del config_dict["llm"]["azure_openai"]
+        if not config_dict["llm"]["cache_ttl"]:
+            del config_dict["llm"]["cache_ttl"]
 
         # Remove None values from jira config
         if config_dict["jira"]["ticket_pattern"] is None:
@@ -216,9 +244,11 @@ class ConfigLoader:
 
         try:
             with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+                yaml.dump(config_dict, f, Dumper=SafeDumper, default_flow_style=False, indent=2)
         except Exception as e:
             raise ConfigError(f"Failed to save config to {config_path}: {e}")
+        finally:
+            _parse_yaml_file.cache_clear()
 
     def set_value(self, key_path: str, value: str) -> None:
         """Set a configuration value using dot notation (e.g., 'llm.default_model')."""
@@ -239,6 +269,12 @@ class ConfigLoader:
         # Handle llm.azure_openai.*
         elif keys[0] == "llm" and keys[1] == "azure_openai" and len(keys) == 3:
             self._config.llm.azure_openai[keys[2]] = value
+        # Handle llm.cache_ttl
+        elif keys[0] == "llm" and keys[1] == "cache_ttl":
+            try:
+                self._config.llm.cache_ttl = int(value)
+            except ValueError:
+                raise ConfigError(f"Invalid cache TTL (expected seconds): {value}")
         # Handle jira.enabled
         elif keys[0] == "jira" and keys[1] == "enabled":
             self._config.jira.enabled = value.lower() in ("true", "1", "yes", "on")
@@ -270,6 +306,9 @@ class ConfigLoader:
         # Handle llm.azure_openai.*
         elif keys[0] == "llm" and keys[1] == "azure_openai" and len(keys) == 3:
             return self._config.llm.azure_openai.get(keys[2])
+        # Handle llm.cache_ttl
+        elif keys[0] == "llm" and keys[1] == "cache_ttl":
+            return self._config.llm.cache_ttl
         # Handle jira.enabled
         elif keys[0] == "jira" and keys[1] == "enabled":
             return self._config.jira.enabled
@@ -291,6 +330,7 @@ class ConfigLoader:
         """Reset singleton instance for testing."""
         cls._instance = None
         cls._config = None
+        _parse_yaml_file.cache_clear()
 
 
 def get_config() -> AppConfig:
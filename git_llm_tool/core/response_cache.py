@@ -0,0 +1,81 @@
+"""On-disk cache of LLM responses for git-llm-tool."""
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """File-based cache mapping prompt hashes to LLM responses."""
+
+    def __init__(self, ttl: int, cache_dir: Optional[Path] = None):
+        """Initialize response cache.
+
+        Args:
+            ttl: Number of seconds a cached response stays valid
+            cache_dir: Cache directory (default: ~/.cache/git-llm-tool/responses)
+        """
+        self.ttl = ttl
+        self.cache_dir = cache_dir or Path.home() / ".cache" / "git-llm-tool" / "responses"
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the parts that determine a response.
+
+        Args:
+            *parts: Provider, model, generation parameters and prompt
+
+        Returns:
+            Hex digest identifying the request
+        """
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        path = self._get_path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, replacing any previous entry atomically.
+
+        Caching is best effort: write failures are ignored.
+
+        Args:
+            key: Cache key from make_key
+            response: Response text to store
+        """
+        path = self._get_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(response)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
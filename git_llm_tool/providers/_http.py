@@ -0,0 +1,35 @@
+"""Shared HTTP client for LLM providers."""
+
+import atexit
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+# Sized so concurrent commit/changelog calls never wait on httpx's small
+# default pool
+_POOL_LIMITS = {
+    "max_connections": 200,
+    "max_keepalive_connections": 50,
+    "keepalive_expiry": 30,
+}
+
+_shared_client: Optional["httpx.Client"] = None
+
+
+def get_shared_httpx_client() -> "httpx.Client":
+    """Get the process-wide HTTP client used by provider SDK clients.
+
+    Sharing one connection pool lets every provider instance reuse
+    keep-alive connections instead of paying a new TLS handshake.
+
+    Returns:
+        Lazily created httpx client, closed automatically at exit
+    """
+    global _shared_client
+    if _shared_client is None:
+        import httpx
+
+        _shared_client = httpx.Client(limits=httpx.Limits(**_POOL_LIMITS))
+        atexit.register(_shared_client.close)
+    return _shared_client
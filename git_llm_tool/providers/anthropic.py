@@ -1,11 +1,11 @@
 """Anthropic Claude LLM provider implementation."""
 
 from typing import Optional
-import anthropic
 
 from git_llm_tool.core.config import AppConfig
 from git_llm_tool.core.exceptions import ApiError
 from git_llm_tool.providers.base import LlmProvider
+from git_llm_tool.providers._http import get_shared_httpx_client
 
 
 class AnthropicProvider(LlmProvider):
@@ -13,6 +13,9 @@ class AnthropicProvider(LlmProvider):
 
     def __init__(self, config: AppConfig):
         """Initialize Anthropic provider."""
+        # Imported lazily: the SDK is slow to import and most CLI commands never call it
+        import anthropic
+
         super().__init__(config)
 
         # Get API key
@@ -21,7 +24,9 @@ class AnthropicProvider(LlmProvider):
             raise ApiError("Anthropic API key not found in configuration")
 
         # Initialize Anthropic client
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = anthropic.Anthropic(
+            api_key=api_key, http_client=get_shared_httpx_client()
+        )
 
         # Determine model
         model = config.llm.default_model
@@ -39,7 +44,7 @@ class AnthropicProvider(LlmProvider):
     ) -> str:
         """Generate commit message using Anthropic API."""
         prompt = self._build_commit_prompt(diff, jira_ticket, work_hours)
-        return self._make_api_call(prompt, **kwargs)
+        return self._call_api(prompt, **kwargs)
 
     def generate_changelog(
         self,
@@ -47,11 +52,12 @@ class AnthropicProvider(LlmProvider):
         **kwargs
     ) -> str:
         """Generate changelog using Anthropic API."""
-        prompt = self._build_changelog_prompt(commit_messages)
-        return self._make_api_call(prompt, **kwargs)
+        return self._generate_changelog(commit_messages, **kwargs)
 
     def _make_api_call(self, prompt: str, **kwargs) -> str:
         """Make API call to Anthropic."""
+        import anthropic
+
         try:
             # Default parameters
             api_params = {
@@ -1,11 +1,23 @@
 """Azure OpenAI LLM provider implementation."""
 
 from typing import Optional
-import openai
 
 from git_llm_tool.core.config import AppConfig
 from git_llm_tool.core.exceptions import ApiError
 from git_llm_tool.providers.base import LlmProvider
+from git_llm_tool.providers._http import get_shared_httpx_client
+from git_llm_tool.providers.openai import (
+    SYSTEM_MESSAGE,
+    extract_choice_content,
+    resolve_openai_model,
+    stream_choice_content,
+)
+
+# Defaults used when the Azure OpenAI configuration omits a value
+_AZURE_DEFAULTS = {
+    "api_version": "2024-02-15-preview",
+    "fallback_model": "gpt-4o",
+}
 
 
 class AzureOpenAiProvider(LlmProvider):
@@ -13,6 +25,9 @@ class AzureOpenAiProvider(LlmProvider):
 
     def __init__(self, config: AppConfig):
         """Initialize Azure OpenAI provider."""
+        # Imported lazily: the SDK is slow to import and most CLI commands never call it
+        import openai
+
         super().__init__(config)
 
         # Get Azure OpenAI configuration
@@ -25,27 +40,27 @@ class AzureOpenAiProvider(LlmProvider):
             raise ApiError("Azure OpenAI API key not found in configuration")
 
         # Default values for Azure OpenAI
-        api_version = azure_config.get("api_version", "2024-02-15-preview")
-        deployment_name = azure_config.get("deployment_name")
+        api_version = azure_config.get("api_version", _AZURE_DEFAULTS["api_version"])
 
         # Initialize Azure OpenAI client
         self.client = openai.AzureOpenAI(
             api_key=api_key,
             api_version=api_version,
-            azure_endpoint=azure_config["endpoint"]
+            azure_endpoint=azure_config["endpoint"],
+            http_client=get_shared_httpx_client()
         )
 
-        # Use deployment name if provided, otherwise use model name
-        if deployment_name:
-            self.model = deployment_name
-        else:
-            # For Azure, we typically use deployment names instead of model names
-            model = config.llm.default_model
-            if model.startswith(("gpt-", "o1-")):
-                self.model = model
-            else:
-                # Default to gpt-4o deployment if model doesn't look like OpenAI model
-                self.model = "gpt-4o"
+        # Resolve the deployment once: explicit deployment name, then an
+        # OpenAI-looking model name, then the gpt-4o fallback deployment
+        self._context_model = resolve_openai_model(
+            config.llm.default_model, _AZURE_DEFAULTS["fallback_model"]
+        )
+        self.model = azure_config.get("deployment_name") or self._context_model
+
+    @property
+    def context_model(self) -> str:
+        """Model family behind the deployment; deployment names are arbitrary."""
+        return self._context_model
 
     def generate_commit_message(
         self,
@@ -56,7 +71,7 @@ class AzureOpenAiProvider(LlmProvider):
     ) -> str:
         """Generate commit message using Azure OpenAI API."""
         prompt = self._build_commit_prompt(diff, jira_ticket, work_hours)
-        return self._make_api_call(prompt, **kwargs)
+        return self._call_api(prompt, **kwargs)
 
     def generate_changelog(
         self,
@@ -64,37 +79,33 @@ class AzureOpenAiProvider(LlmProvider):
         **kwargs
     ) -> str:
         """Generate changelog using Azure OpenAI API."""
-        prompt = self._build_changelog_prompt(commit_messages)
-        return self._make_api_call(prompt, **kwargs)
+        return self._generate_changelog(commit_messages, **kwargs)
 
     def _make_api_call(self, prompt: str, **kwargs) -> str:
         """Make API call to Azure OpenAI."""
+        import openai
+
         try:
             # Default parameters
             api_params = {
                 "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that generates git commit messages and changelogs."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                "messages": [SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 "max_tokens": kwargs.get("max_tokens", 150),
                 "temperature": kwargs.get("temperature", 0.7),
             }
 
-            # Make API call
-            response = self.client.chat.completions.create(**api_params)
+            # Make API call, echoing tokens as they arrive when streaming
+            if kwargs.get("stream", False):
+                api_params["stream"] = True
+                chunks = self.client.chat.completions.create(**api_params)
+                content = stream_choice_content(chunks)
+                self.last_response_streamed = content is not None
+            else:
+                response = self.client.chat.completions.create(**api_params)
+                content = extract_choice_content(response)
 
-            # Extract response text
-            if response.choices and len(response.choices) > 0:
-                content = response.choices[0].message.content
-                if content:
-                    return content.strip()
+            if content is not None:
+                return content
 
             raise ApiError("Empty response from Azure OpenAI API")
 
@@ -1,16 +1,21 @@
 """Base LLM provider interface."""
 
+import functools
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
 from git_llm_tool.core.config import AppConfig
+from git_llm_tool.core.response_cache import ResponseCache
 
 
 class PromptTemplates:
     """Centralized prompt templates for better code readability."""
 
-    # Base prompt with conventional commit types
-    BASE_COMMIT_PROMPT = """Based on the following git diff, generate a concise commit message in {language}.
+    # Base prompt with conventional commit types. Static instructions come
+    # before the diff so repeated requests share a byte-identical prefix,
+    # which lets providers with automatic prompt caching reuse it.
+    BASE_COMMIT_PROMPT = """Based on the git diff below, generate a concise commit message in {language}.
 
 **Conventional Commit types**:
 - feat: new feature
@@ -20,11 +25,7 @@ class PromptTemplates:
 - refactor: code restructuring without changing functionality
 - test: adding or modifying tests
 - chore: maintenance tasks
-
-Git diff:
-```
-{diff}
-```"""
+"""
 
     # Format for commits without Jira tickets
     NO_JIRA_FORMAT = """
@@ -74,17 +75,138 @@ Example format:
 - feat: implement JWT token validation
 - docs: update API documentation"""
 
+    # Git diff, placed after all static instructions
+    DIFF_SECTION = """
+
+Git diff:
+```
+{diff}
+```"""
+
     # Final instruction
     FINAL_INSTRUCTION = "\n\nGenerate ONLY the commit message in the specified format, no additional text or explanation."
 
+    # Changelog prompt, split around the list of commit messages
+    CHANGELOG_PREFIX = """Generate a structured changelog in {language} from the following commit messages.
+
+Organize by categories:
+✨ **Features**
+🐛 **Bug Fixes**
+📚 **Documentation**
+🎨 **Style**
+♻️ **Refactoring**
+🧪 **Tests**
+🔧 **Chores**
+💥 **Breaking Changes**
+
+Only include categories that have items. Use markdown format.
+
+Commit messages:
+"""
+
+    CHANGELOG_SUFFIX = "\n\nGenerate the changelog:"
+
+    # Merge prompt for changelogs generated from several commit batches
+    CHANGELOG_MERGE_PREFIX = """Merge the following partial changelogs into a single structured changelog in {language}.
+
+Combine items that belong to the same category, remove duplicates and keep the category headings.
+Only include categories that have items. Use markdown format.
+
+Partial changelogs:
+"""
+
+    CHANGELOG_MERGE_SUFFIX = "\n\nGenerate the merged changelog:"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def commit_template(has_jira_ticket: bool, has_work_hours: bool) -> str:
+        """Assemble the commit prompt template for a Jira/time-tracking variant.
+
+        Only three variants exist, so each one is joined once and reused.
+        """
+        prompt_parts = [PromptTemplates.BASE_COMMIT_PROMPT]
+
+        # Add format-specific instructions
+        if has_jira_ticket:
+            prompt_parts.append(PromptTemplates.JIRA_FORMAT)
+
+            # Add time tracking instructions
+            if has_work_hours:
+                prompt_parts.append(PromptTemplates.EXACT_TIME_INSTRUCTION)
+            else:
+                prompt_parts.append(PromptTemplates.ESTIMATE_TIME_INSTRUCTION)
+        else:
+            prompt_parts.append(PromptTemplates.NO_JIRA_FORMAT)
+
+        # Add the diff and final instruction
+        prompt_parts.append(PromptTemplates.DIFF_SECTION)
+        prompt_parts.append(PromptTemplates.FINAL_INSTRUCTION)
+
+        return "".join(prompt_parts)
+
 
 class LlmProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Commits per changelog request; longer ranges are split into batches
+    CHANGELOG_BATCH_SIZE = 100
+
+    # Upper bound on concurrent API calls for batched requests
+    MAX_PARALLEL_REQUESTS = 8
+
+    # Input budget for the diff by model prefix, checked in order so the more
+    # specific prefixes match first. Each budget stays below the model's
+    # context window to leave room for the instructions and the response.
+    DIFF_TOKEN_BUDGETS = (
+        ("gpt-4o", 100_000),
+        ("gpt-4-turbo", 100_000),
+        ("o1-", 100_000),
+        ("gpt-4", 6_000),
+        ("gpt-3.5-turbo", 12_000),
+        ("claude-", 150_000),
+        ("gemini-", 150_000),
+    )
+
+    # Budget for unknown models (e.g. Azure deployment names), sized for the
+    # smallest supported context window (8k tokens)
+    DEFAULT_DIFF_TOKENS = 6_000
+
+    # Fixed diff budget overriding the per-model table when set
+    MAX_DIFF_TOKENS: Optional[int] = None
+
+    # Conservative characters-per-token ratio; code diffs average about 3
+    CHARS_PER_TOKEN = 3
+
     def __init__(self, config: AppConfig):
         """Initialize the provider with configuration."""
         self.config = config
 
+        # The static part of the changelog prompt only depends on the language
+        self._changelog_prefix = PromptTemplates.CHANGELOG_PREFIX.format(
+            language=config.llm.language
+        )
+
+        # Whether the last commit prompt dropped part of an oversized diff
+        self.last_diff_truncated = False
+
+        # Whether the last API call echoed its response while streaming
+        self.last_response_streamed = False
+
+        # Identical prompts reuse earlier responses while llm.cache_ttl is set
+        self._response_cache = (
+            ResponseCache(ttl=config.llm.cache_ttl) if config.llm.cache_ttl > 0 else None
+        )
+
+    @property
+    def model_name(self) -> str:
+        """Resolved model identifier that requests are sent to."""
+        return self.model
+
+    @property
+    def context_model(self) -> str:
+        """Model family whose context window sizes the diff budget."""
+        return self.model_name
+
     @abstractmethod
     def generate_commit_message(
         self,
@@ -136,55 +258,143 @@ class LlmProvider(ABC):
         # Prepare all template variables
         template_vars = {
             "language": self.config.llm.language,
-            "diff": diff,
+            "diff": self._truncate_diff(diff),
             "jira_ticket": jira_ticket or "",
             "work_hours": work_hours or "",
         }
 
-        # Build prompt components
-        prompt_parts = [PromptTemplates.BASE_COMMIT_PROMPT]
+        # Reuse the assembled template and format all parts at once
+        full_template = PromptTemplates.commit_template(
+            bool(jira_ticket), bool(work_hours)
+        )
+        return full_template.format(**template_vars)
 
-        # Add format-specific instructions
-        if jira_ticket:
-            prompt_parts.append(PromptTemplates.JIRA_FORMAT)
+    def _max_diff_tokens(self) -> int:
+        """Return the diff token budget for the resolved model."""
+        if self.MAX_DIFF_TOKENS is not None:
+            return self.MAX_DIFF_TOKENS
 
-            # Add time tracking instructions
-            if work_hours:
-                prompt_parts.append(PromptTemplates.EXACT_TIME_INSTRUCTION)
-            else:
-                prompt_parts.append(PromptTemplates.ESTIMATE_TIME_INSTRUCTION)
-        else:
-            prompt_parts.append(PromptTemplates.NO_JIRA_FORMAT)
+        for prefix, budget in self.DIFF_TOKEN_BUDGETS:
+            if self.context_model.startswith(prefix):
+                return budget
+        return self.DEFAULT_DIFF_TOKENS
 
-        # Add final instruction
-        prompt_parts.append(PromptTemplates.FINAL_INSTRUCTION)
+    def _truncate_diff(self, diff: str) -> str:
+        """Keep the head and tail of a diff that exceeds the model's budget."""
+        max_chars = self._max_diff_tokens() * self.CHARS_PER_TOKEN
+        self.last_diff_truncated = len(diff) > max_chars
+        if not self.last_diff_truncated:
+            return diff
 
-        # Combine and format all parts at once
-        full_template = "".join(prompt_parts)
-        return full_template.format(**template_vars)
+        keep = max_chars // 2
+        truncated = len(diff) - 2 * keep
+        return f"{diff[:keep]}\n...[truncated {truncated} characters]...\n{diff[-keep:]}"
 
     def _build_changelog_prompt(self, commit_messages: list[str]) -> str:
         """Build prompt for changelog generation."""
-        commits_text = "\n".join([f"- {msg}" for msg in commit_messages])
+        # Join the existing list directly instead of formatting each message
+        commits_text = "- " + "\n- ".join(commit_messages) if commit_messages else ""
 
-        return f"""Generate a structured changelog in {self.config.llm.language} from the following commit messages.
+        return self._changelog_prefix + commits_text + PromptTemplates.CHANGELOG_SUFFIX
 
-Organize by categories:
-✨ **Features**
-🐛 **Bug Fixes**
-📚 **Documentation**
-🎨 **Style**
-♻️ **Refactoring**
-🧪 **Tests**
-🔧 **Chores**
-💥 **Breaking Changes**
+    def _build_changelog_merge_prompt(self, partial_changelogs: list[str]) -> str:
+        """Build prompt for merging changelogs generated from commit batches."""
+        return (
+            PromptTemplates.CHANGELOG_MERGE_PREFIX.format(language=self.config.llm.language)
+            + "\n\n---\n\n".join(partial_changelogs)
+            + PromptTemplates.CHANGELOG_MERGE_SUFFIX
+        )
 
-Only include categories that have items. Use markdown format.
+    def _build_changelog_batch_prompts(self, commit_messages: list[str]) -> list[str]:
+        """Build one changelog prompt per batch of CHANGELOG_BATCH_SIZE commits."""
+        batch_size = self.CHANGELOG_BATCH_SIZE
+        if len(commit_messages) <= batch_size:
+            return [self._build_changelog_prompt(commit_messages)]
 
-Commit messages:
-{commits_text}
+        return [
+            self._build_changelog_prompt(commit_messages[i:i + batch_size])
+            for i in range(0, len(commit_messages), batch_size)
+        ]
+
+    def _generate_changelog(self, commit_messages: list[str], **kwargs) -> str:
+        """Generate changelog, splitting long commit ranges into parallel calls.
+
+        Ranges of up to CHANGELOG_BATCH_SIZE commits use a single API call.
+        Longer ranges are summarized batch by batch concurrently, then the
+        partial changelogs are merged with one final call.
+
+        Args:
+            commit_messages: List of commit messages
+            **kwargs: Provider-specific arguments passed to each API call
+
+        Returns:
+            Generated changelog in markdown format
+
+        Raises:
+            ApiError: If any API call fails
+        """
+        prompts = self._build_changelog_batch_prompts(commit_messages)
+        if len(prompts) == 1:
+            return self._call_api(prompts[0], **kwargs)
+
+        partial_changelogs = self._make_api_calls_parallel(prompts, **kwargs)
 
-Generate the changelog:"""
+        merge_prompt = self._build_changelog_merge_prompt(partial_changelogs)
+        return self._call_api(merge_prompt, **kwargs)
+
+    def _make_api_calls_parallel(self, prompts: list[str], **kwargs) -> list[str]:
+        """Make several API calls concurrently.
+
+        Args:
+            prompts: Prompts to send
+            **kwargs: Provider-specific arguments passed to each API call
+
+        Returns:
+            Generated responses in the same order as the prompts
+
+        Raises:
+            ApiError: If any API call fails
+        """
+        max_workers = min(self.MAX_PARALLEL_REQUESTS, len(prompts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda prompt: self._call_api(prompt, **kwargs), prompts)
+            )
+
+    def _call_api(self, prompt: str, **kwargs) -> str:
+        """Make an API call, reusing a cached response for an identical request.
+
+        The cache key covers the provider, model, generation parameters and
+        the full prompt, so any change to the diff or settings misses.
+
+        Args:
+            prompt: The prompt to send
+            **kwargs: Provider-specific arguments
+
+        Returns:
+            Generated text response
+
+        Raises:
+            ApiError: If API call fails
+        """
+        self.last_response_streamed = False
+        if self._response_cache is None:
+            return self._make_api_call(prompt, **kwargs)
+
+        key = ResponseCache.make_key(
+            self.__class__.__name__,
+            self.model_name,
+            str(kwargs.get("max_tokens")),
+            str(kwargs.get("temperature")),
+            prompt,
+        )
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._make_api_call(prompt, **kwargs)
+        self._response_cache.set(key, response)
+        return response
 
     @abstractmethod
     def _make_api_call(self, prompt: str, **kwargs) -> str:
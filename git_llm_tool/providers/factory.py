@@ -3,7 +3,7 @@
 from git_llm_tool.core.config import AppConfig
 from git_llm_tool.core.exceptions import ApiError
 from git_llm_tool.providers.base import LlmProvider
-from git_llm_tool.providers.openai import OpenAiProvider
+from git_llm_tool.providers.openai import OPENAI_MODEL_PREFIXES, OpenAiProvider
 from git_llm_tool.providers.azure_openai import AzureOpenAiProvider
 from git_llm_tool.providers.anthropic import AnthropicProvider
 from git_llm_tool.providers.gemini import GeminiProvider
@@ -25,13 +25,13 @@ def get_provider(config: AppConfig) -> LlmProvider:
 
     # Check if Azure OpenAI is configured (highest priority for OpenAI-compatible models)
     if config.llm.azure_openai and config.llm.azure_openai.get("endpoint"):
-        if model.startswith(("gpt-", "o1-")) or "azure" in model:
+        if model.startswith(OPENAI_MODEL_PREFIXES) or "azure" in model:
             if "azure_openai" not in config.llm.api_keys:
                 raise ApiError("Azure OpenAI API key required for Azure OpenAI models")
             return AzureOpenAiProvider(config)
 
     # OpenAI models (regular OpenAI API)
-    if model.startswith(("gpt-", "o1-")):
+    if model.startswith(OPENAI_MODEL_PREFIXES):
         if "openai" not in config.llm.api_keys:
             raise ApiError("OpenAI API key required for GPT models")
         return OpenAiProvider(config)
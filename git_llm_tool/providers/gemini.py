@@ -1,7 +1,6 @@
 """Google Gemini LLM provider implementation."""
 
 from typing import Optional
-import google.generativeai as genai
 
 from git_llm_tool.core.config import AppConfig
 from git_llm_tool.core.exceptions import ApiError
@@ -13,6 +12,9 @@ class GeminiProvider(LlmProvider):
 
     def __init__(self, config: AppConfig):
         """Initialize Gemini provider."""
+        # Imported lazily: the SDK is slow to import and most CLI commands never call it
+        import google.generativeai as genai
+
         super().__init__(config)
 
         # Get API key
@@ -28,8 +30,14 @@ class GeminiProvider(LlmProvider):
         if not model.startswith("gemini-"):
             # Fallback to Gemini Pro if model doesn't look like Google model
             model = "gemini-1.5-pro"
+        self._model_name = model
         self.model = genai.GenerativeModel(model)
 
+    @property
+    def model_name(self) -> str:
+        """Resolved model identifier; self.model holds the SDK model object."""
+        return self._model_name
+
     def generate_commit_message(
         self,
         diff: str,
@@ -39,7 +47,7 @@ class GeminiProvider(LlmProvider):
     ) -> str:
         """Generate commit message using Gemini API."""
         prompt = self._build_commit_prompt(diff, jira_ticket, work_hours)
-        return self._make_api_call(prompt, **kwargs)
+        return self._call_api(prompt, **kwargs)
 
     def generate_changelog(
         self,
@@ -47,11 +55,12 @@ class GeminiProvider(LlmProvider):
         **kwargs
     ) -> str:
         """Generate changelog using Gemini API."""
-        prompt = self._build_changelog_prompt(commit_messages)
-        return self._make_api_call(prompt, **kwargs)
+        return self._generate_changelog(commit_messages, **kwargs)
 
     def _make_api_call(self, prompt: str, **kwargs) -> str:
         """Make API call to Gemini."""
+        import google.generativeai as genai
+
         try:
             # Configure generation parameters
             generation_config = genai.types.GenerationConfig(
@@ -1,11 +1,91 @@
 """OpenAI LLM provider implementation."""
 
-from typing import Optional
-import openai
+import functools
+import json
+import time
+from typing import TYPE_CHECKING, Iterable, Optional
+import click
 
 from git_llm_tool.core.config import AppConfig
 from git_llm_tool.core.exceptions import ApiError
 from git_llm_tool.providers.base import LlmProvider
+from git_llm_tool.providers._http import get_shared_httpx_client
+
+if TYPE_CHECKING:
+    import openai
+
+# Batch API settings for offline changelog generation
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_POLL_INTERVAL = 30  # seconds
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# System message shared by every chat completion request
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant that generates git commit messages and changelogs."
+}
+
+# Model name prefixes served by OpenAI-compatible APIs
+OPENAI_MODEL_PREFIXES = ("gpt-", "o1-")
+
+
+@functools.lru_cache(maxsize=32)
+def resolve_openai_model(model: str, fallback: str = "gpt-4o") -> str:
+    """Return the model name if it looks like an OpenAI model, else the fallback."""
+    return model if model.startswith(OPENAI_MODEL_PREFIXES) else fallback
+
+
+@functools.lru_cache(maxsize=8)
+def _get_sync_client(api_key: str) -> "openai.OpenAI":
+    """Get a cached OpenAI client for the given API key.
+
+    Providers created with the same key reuse one client instead of
+    rebuilding it on every construction.
+    """
+    # Imported lazily: the SDK is slow to import and most CLI commands never call it
+    import openai
+
+    return openai.OpenAI(api_key=api_key, http_client=get_shared_httpx_client())
+
+
+def extract_choice_content(response) -> Optional[str]:
+    """Extract the text of the first choice from a chat completion response.
+
+    Args:
+        response: Chat completion response from an OpenAI-compatible API
+
+    Returns:
+        Stripped message content, or None if the response has no content
+    """
+    if response.choices:
+        content = response.choices[0].message.content
+        if content:
+            return content.strip()
+    return None
+
+
+def stream_choice_content(chunks: Iterable) -> Optional[str]:
+    """Collect a streamed chat completion, echoing each delta as it arrives.
+
+    Args:
+        chunks: Stream of chat completion chunks
+
+    Returns:
+        Stripped message content, or None if nothing was streamed
+    """
+    parts = []
+    for chunk in chunks:
+        if chunk.choices:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                click.echo(delta, nl=False)
+
+    if not parts:
+        return None
+
+    click.echo()
+    return "".join(parts).strip()
 
 
 class OpenAiProvider(LlmProvider):
@@ -21,14 +101,19 @@ class OpenAiProvider(LlmProvider):
             raise ApiError("OpenAI API key not found in configuration")
 
         # Initialize OpenAI client
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = _get_sync_client(api_key)
+
+        # Determine model, falling back to GPT-4o for non-OpenAI names
+        self.model = resolve_openai_model(config.llm.default_model)
 
-        # Determine model
-        model = config.llm.default_model
-        if not model.startswith(("gpt-", "o1-")):
-            # Fallback to GPT-4o if model doesn't look like OpenAI model
-            model = "gpt-4o"
-        self.model = model
+        # Parameters fixed for this provider are bound once; each call only
+        # supplies messages and any max_tokens/temperature overrides
+        self._create_completion = functools.partial(
+            self.client.chat.completions.create,
+            model=self.model,
+            max_tokens=150,
+            temperature=0.7,
+        )
 
     def generate_commit_message(
         self,
@@ -39,7 +124,7 @@ class OpenAiProvider(LlmProvider):
     ) -> str:
         """Generate commit message using OpenAI API."""
         prompt = self._build_commit_prompt(diff, jira_ticket, work_hours)
-        return self._make_api_call(prompt, **kwargs)
+        return self._call_api(prompt, **kwargs)
 
     def generate_changelog(
         self,
@@ -47,37 +132,143 @@ class OpenAiProvider(LlmProvider):
         **kwargs
     ) -> str:
         """Generate changelog using OpenAI API."""
-        prompt = self._build_changelog_prompt(commit_messages)
-        return self._make_api_call(prompt, **kwargs)
+        return self._generate_changelog(commit_messages, **kwargs)
+
+    def generate_changelog_batch(
+        self,
+        commit_messages: list[str],
+        **kwargs
+    ) -> str:
+        """Generate changelog using the OpenAI Batch API.
+
+        Batch requests are billed at a discount and use a separate rate-limit
+        pool, but may take up to 24 hours to complete, so this is meant for
+        offline release-note jobs rather than interactive use.
+
+        Args:
+            commit_messages: List of commit messages
+            **kwargs: Additional provider-specific arguments
+
+        Returns:
+            Generated changelog in markdown format
+
+        Raises:
+            ApiError: If the batch fails or API call fails
+        """
+        import openai
+
+        prompts = self._build_changelog_batch_prompts(commit_messages)
+
+        try:
+            partial_changelogs = self._run_batch(prompts, **kwargs)
+        except ApiError:
+            raise
+        except openai.AuthenticationError:
+            raise ApiError("Invalid OpenAI API key")
+        except openai.RateLimitError:
+            raise ApiError("OpenAI API rate limit exceeded")
+        except openai.APIConnectionError:
+            raise ApiError("Failed to connect to OpenAI API")
+        except openai.APIError as e:
+            raise ApiError(f"OpenAI API error: {e}")
+        except Exception as e:
+            raise ApiError(f"Unexpected error calling OpenAI Batch API: {e}")
+
+        if len(partial_changelogs) == 1:
+            return partial_changelogs[0]
+
+        merge_prompt = self._build_changelog_merge_prompt(partial_changelogs)
+        return self._call_api(merge_prompt, **kwargs)
+
+    def _run_batch(self, prompts: list[str], **kwargs) -> list[str]:
+        """Submit prompts as one batch job and wait for the results.
+
+        Args:
+            prompts: Prompts to send
+            **kwargs: Provider-specific arguments applied to every request
+
+        Returns:
+            Generated responses in the same order as the prompts
+
+        Raises:
+            ApiError: If the batch does not complete or results are missing
+        """
+        lines = [
+            json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": self._build_api_params(prompt, **kwargs),
+            })
+            for index, prompt in enumerate(prompts)
+        ]
+        input_file = self.client.files.create(
+            file=("changelog-batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+
+        # Poll until the batch reaches a terminal state
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise ApiError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+
+        # Results are not guaranteed to be in input order
+        results = {}
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            body = (result.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            if choices and choices[0]["message"].get("content"):
+                results[int(result["custom_id"])] = choices[0]["message"]["content"].strip()
+
+        if len(results) != len(prompts):
+            raise ApiError(
+                f"OpenAI batch {batch.id} returned {len(results)} of {len(prompts)} results"
+            )
+
+        return [results[index] for index in range(len(prompts))]
+
+    def _build_api_params(self, prompt: str, **kwargs) -> dict:
+        """Build chat completion request parameters for a prompt."""
+        return {
+            "model": self.model,
+            "messages": [SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            "max_tokens": kwargs.get("max_tokens", 150),
+            "temperature": kwargs.get("temperature", 0.7),
+        }
 
     def _make_api_call(self, prompt: str, **kwargs) -> str:
         """Make API call to OpenAI."""
+        import openai
+
         try:
-            # Default parameters
-            api_params = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that generates git commit messages and changelogs."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": kwargs.get("max_tokens", 150),
-                "temperature": kwargs.get("temperature", 0.7),
+            messages = [SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+            overrides = {
+                key: kwargs[key] for key in ("max_tokens", "temperature") if key in kwargs
             }
 
-            # Make API call
-            response = self.client.chat.completions.create(**api_params)
+            # Make API call, echoing tokens as they arrive when streaming
+            if kwargs.get("stream", False):
+                chunks = self._create_completion(messages=messages, stream=True, **overrides)
+                content = stream_choice_content(chunks)
+                self.last_response_streamed = content is not None
+            else:
+                response = self._create_completion(messages=messages, **overrides)
+                content = extract_choice_content(response)
 
-            # Extract response text
-            if response.choices and len(response.choices) > 0:
-                content = response.choices[0].message.content
-                if content:
-                    return content.strip()
+            if content is not None:
+                return content
 
             raise ApiError("Empty response from OpenAI API")
 
@@ -0,0 +1,78 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from click.testing import CliRunner
+
+from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
+from git_llm_tool.providers.base import LlmProvider
+
+
+class _StubProvider(LlmProvider):
+    """Provider that records prompts instead of calling an API."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.model = config.llm.default_model
+        self.prompts = []
+
+    def generate_commit_message(self, diff, **kwargs):
+        return ""
+
+    def generate_changelog(self, commit_messages, **kwargs):
+        return self._generate_changelog(commit_messages, **kwargs)
+
+    def _make_api_call(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return f"response {len(self.prompts)}"
+
+
+@pytest.fixture
+def stub_provider():
+    """Provider class that records prompts instead of calling an API."""
+    return _StubProvider
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """CLI runner shared by the tests of a module."""
+    return CliRunner()
+
+
+# Provider configurations are never mutated by the tests, so one instance
+# of each is shared across the whole session
+
+
+@pytest.fixture(scope="session")
+def openai_config():
+    """Configuration with an OpenAI model and key."""
+    return AppConfig(
+        llm=LlmConfig(default_model="gpt-4o", api_keys={"openai": "sk-test-key"}),
+        jira=JiraConfig()
+    )
+
+
+@pytest.fixture(scope="session")
+def anthropic_config():
+    """Configuration with a Claude model and Anthropic key."""
+    return AppConfig(
+        llm=LlmConfig(default_model="claude-3-sonnet", api_keys={"anthropic": "sk-ant-test-key"}),
+        jira=JiraConfig()
+    )
+
+
+@pytest.fixture(scope="session")
+def gemini_config():
+    """Configuration with a Gemini model and Google key."""
+    return AppConfig(
+        llm=LlmConfig(default_model="gemini-1.5-pro", api_keys={"google": "test-google-key"}),
+        jira=JiraConfig()
+    )
+
+
+@pytest.fixture(scope="session")
+def no_api_key_config():
+    """Configuration without any API keys."""
+    return AppConfig(
+        llm=LlmConfig(default_model="gpt-4o", api_keys={}),
+        jira=JiraConfig()
+    )
@@ -1,19 +1,20 @@
 """Tests for CLI interface."""
 
 import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, Mock
 
 from git_llm_tool.cli import main
 from git_llm_tool.core.exceptions import ConfigError, GitError, ApiError
+from git_llm_tool.providers import (
+    AnthropicProvider, AzureOpenAiProvider, GeminiProvider, OpenAiProvider
+)
 
 
 class TestCLI:
     """Test CLI functionality."""
 
-    def test_main_help(self):
+    def test_main_help(self, runner):
         """Test main command help."""
-        runner = CliRunner()
         result = runner.invoke(main, ['--help'])
 
         assert result.exit_code == 0
@@ -22,17 +23,15 @@ class TestCLI:
         assert "config" in result.output
         assert "changelog" in result.output
 
-    def test_version(self):
+    def test_version(self, runner):
         """Test version command."""
-        runner = CliRunner()
         result = runner.invoke(main, ['--version'])
 
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_commit_help(self):
+    def test_commit_help(self, runner):
         """Test commit command help."""
-        runner = CliRunner()
         result = runner.invoke(main, ['commit', '--help'])
 
         assert result.exit_code == 0
@@ -41,9 +40,8 @@ class TestCLI:
         assert "--model" in result.output
         assert "--language" in result.output
 
-    def test_changelog_help(self):
+    def test_changelog_help(self, runner):
         """Test changelog command help."""
-        runner = CliRunner()
         result = runner.invoke(main, ['changelog', '--help'])
 
         assert result.exit_code == 0
@@ -52,9 +50,8 @@ class TestCLI:
         assert "--to" in result.output
         assert "--output" in result.output
 
-    def test_config_help(self):
+    def test_config_help(self, runner):
         """Test config command help."""
-        runner = CliRunner()
         result = runner.invoke(main, ['config', '--help'])
 
         assert result.exit_code == 0
@@ -68,12 +65,11 @@ class TestConfigCommands:
     """Test configuration commands."""
 
     @patch('git_llm_tool.cli.ConfigLoader')
-    def test_config_init_success(self, mock_loader):
+    def test_config_init_success(self, mock_loader, runner):
         """Test successful config initialization."""
         mock_instance = Mock()
         mock_loader.return_value = mock_instance
 
-        runner = CliRunner()
         result = runner.invoke(main, ['config', 'init'])
 
         assert result.exit_code == 0
@@ -82,12 +78,11 @@ class TestConfigCommands:
 
     @patch('git_llm_tool.cli.ConfigLoader')
     @patch('pathlib.Path.exists', return_value=True)
-    def test_config_init_existing_file_confirm_yes(self, mock_exists, mock_loader):
+    def test_config_init_existing_file_confirm_yes(self, mock_exists, mock_loader, runner):
         """Test config initialization with existing file - user confirms."""
         mock_instance = Mock()
         mock_loader.return_value = mock_instance
 
-        runner = CliRunner()
         result = runner.invoke(main, ['config', 'init'], input='y\\n')
 
         assert result.exit_code == 0
@@ -96,21 +91,19 @@ class TestConfigCommands:
 
     @patch('git_llm_tool.cli.ConfigLoader')
     @patch('pathlib.Path.exists', return_value=True)
-    def test_config_init_existing_file_confirm_no(self, mock_exists, mock_loader):
+    def test_config_init_existing_file_confirm_no(self, mock_exists, mock_loader, runner):
         """Test config initialization with existing file - user cancels."""
-        runner = CliRunner()
         result = runner.invoke(main, ['config', 'init'], input='n\\n')
 
         assert result.exit_code == 0
         assert "Initialization cancelled" in result.output
 
     @patch('git_llm_tool.cli.ConfigLoader')
-    def test_config_set_success(self, mock_loader):
+    def test_config_set_success(self, mock_loader, runner):
         """Test successful config set."""
         mock_instance = Mock()
         mock_loader.return_value = mock_instance
 
-        runner = CliRunner()
         result = runner.invoke(main, ['config', 'set', 'llm.default_model', 'gpt-4-turbo'])
 
         assert result.exit_code == 0
@@ -119,20 +112,19 @@ class TestConfigCommands:
         mock_instance.save_config.assert_called_once()
 
     @patch('git_llm_tool.cli.ConfigLoader')
-    def test_config_set_error(self, mock_loader):
+    def test_config_set_error(self, mock_loader, runner):
         """Test config set with error."""
         mock_instance = Mock()
         mock_instance.set_value.side_effect = ConfigError("Invalid key")
         mock_loader.return_value = mock_instance
 
-        runner = CliRunner()
         result = runner.invoke(main, ['config', 'set', 'invalid.key', 'value'])
 
         assert result.exit_code == 0
         assert "Configuration error: Invalid key" in result.output
 
     @patch('git_llm_tool.cli.get_config')
-    def test_config_get_all(self, mock_get_config):
+    def test_config_get_all(self, mock_get_config, runner):
         """Test getting all configuration."""
         from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
 
@@ -146,7 +138,6 @@ class TestConfigCommands:
         )
         mock_get_config.return_value = mock_config
 
-        runner = CliRunner()
         result = runner.invoke(main, ['config', 'get'])
 
         assert result.exit_code == 0
@@ -157,13 +148,12 @@ class TestConfigCommands:
         assert "jira.enabled = False" in result.output
 
     @patch('git_llm_tool.cli.ConfigLoader')
-    def test_config_get_specific_key(self, mock_loader):
+    def test_config_get_specific_key(self, mock_loader, runner):
         """Test getting specific configuration key."""
         mock_instance = Mock()
         mock_instance.get_value.return_value = "gpt-4-turbo"
         mock_loader.return_value = mock_instance
 
-        runner = CliRunner()
         result = runner.invoke(main, ['config', 'get', 'llm.default_model'])
 
         assert result.exit_code == 0
@@ -175,9 +165,8 @@ class TestCommitCommand:
     """Test commit command."""
 
     @patch('git_llm_tool.commands.commit_cmd.execute_commit')
-    def test_commit_basic(self, mock_execute):
+    def test_commit_basic(self, mock_execute, runner):
         """Test basic commit command."""
-        runner = CliRunner()
         result = runner.invoke(main, ['commit'])
 
         assert result.exit_code == 0
@@ -185,13 +174,13 @@ class TestCommitCommand:
             apply=False,
             model=None,
             language=None,
+            no_cache=False,
             verbose=False
         )
 
     @patch('git_llm_tool.commands.commit_cmd.execute_commit')
-    def test_commit_with_options(self, mock_execute):
+    def test_commit_with_options(self, mock_execute, runner):
         """Test commit command with options."""
-        runner = CliRunner()
         result = runner.invoke(main, [
             '--verbose', 'commit',
             '--apply',
@@ -204,12 +193,13 @@ class TestCommitCommand:
             apply=True,
             model='gpt-4-turbo',
             language='zh-TW',
+            no_cache=False,
             verbose=True
         )
 
     @patch('git_llm_tool.commands.commit_cmd.get_config')
     @patch('git_llm_tool.commands.commit_cmd.GitHelper')
-    def test_commit_no_staged_changes(self, mock_git_helper, mock_get_config):
+    def test_commit_no_staged_changes(self, mock_git_helper, mock_get_config, runner):
         """Test commit command with no staged changes."""
         from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
 
@@ -220,7 +210,6 @@ class TestCommitCommand:
         mock_helper.get_staged_diff.side_effect = GitError("No staged changes found")
         mock_git_helper.return_value = mock_helper
 
-        runner = CliRunner()
         result = runner.invoke(main, ['commit'])
 
         assert result.exit_code == 0
@@ -229,7 +218,7 @@ class TestCommitCommand:
 
     @patch('git_llm_tool.commands.commit_cmd.get_config')
     @patch('git_llm_tool.commands.commit_cmd.get_provider')
-    def test_commit_no_api_key(self, mock_get_provider, mock_get_config):
+    def test_commit_no_api_key(self, mock_get_provider, mock_get_config, runner):
         """Test commit command with no API key."""
         from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
 
@@ -238,27 +227,101 @@ class TestCommitCommand:
 
         mock_get_provider.side_effect = ApiError("No API keys configured")
 
-        runner = CliRunner()
         result = runner.invoke(main, ['commit'])
 
         assert result.exit_code == 0
         assert "No API keys configured" in result.output
 
+    @patch('git_llm_tool.cli.execute_commit')
+    def test_commit_no_cache_option(self, mock_execute, runner):
+        """Test that --no-cache is passed through to the commit command."""
+        result = runner.invoke(main, ['commit', '--no-cache'])
+
+        assert result.exit_code == 0
+        assert mock_execute.call_args.kwargs["no_cache"] is True
+
+    @patch('git_llm_tool.commands.commit_cmd.get_config')
+    @patch('git_llm_tool.commands.commit_cmd.GitHelper')
+    @patch('git_llm_tool.commands.commit_cmd.get_provider')
+    def test_commit_no_cache_disables_response_cache(
+        self, mock_get_provider, mock_git_helper, mock_get_config, runner
+    ):
+        """Test that --no-cache disables the response cache before the provider is built."""
+        from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
+
+        mock_get_config.return_value = AppConfig(llm=LlmConfig(cache_ttl=3600), jira=JiraConfig())
+        mock_git_helper.return_value.get_staged_diff.return_value = "diff"
+        mock_get_provider.side_effect = ApiError("No API keys configured")
+
+        result = runner.invoke(main, ['commit', '--no-cache'])
+
+        assert result.exit_code == 0
+        assert mock_get_provider.call_args.args[0].llm.cache_ttl == 0
+
+    @patch('git_llm_tool.commands.commit_cmd.get_config')
+    @patch('git_llm_tool.commands.commit_cmd.GitHelper')
+    @patch('git_llm_tool.commands.commit_cmd.JiraHelper')
+    @patch('git_llm_tool.commands.commit_cmd.get_provider')
+    def test_commit_warns_when_diff_truncated(
+        self, mock_get_provider, mock_jira_helper, mock_git_helper, mock_get_config, runner
+    ):
+        """Test that a truncated diff is reported to the user."""
+        from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
+
+        mock_get_config.return_value = AppConfig(llm=LlmConfig(), jira=JiraConfig())
+        mock_git_helper.return_value.get_staged_diff.return_value = "diff"
+        mock_jira_helper.return_value.get_jira_context.return_value = (None, None)
+        mock_provider = Mock()
+        mock_provider.generate_commit_message.return_value = "feat: add feature"
+        mock_provider.last_diff_truncated = True
+        mock_provider.last_response_streamed = False
+        mock_get_provider.return_value = mock_provider
+
+        result = runner.invoke(main, ['commit', '--apply'])
+
+        assert result.exit_code == 0
+        assert "Diff truncated to fit model context" in result.output
+        mock_git_helper.return_value.commit_with_message.assert_called_once_with("feat: add feature")
+
+    @pytest.mark.parametrize("streamed, expected_count", [(True, 0), (False, 1)])
+    @patch('git_llm_tool.commands.commit_cmd.get_config')
+    @patch('git_llm_tool.commands.commit_cmd.GitHelper')
+    @patch('git_llm_tool.commands.commit_cmd.JiraHelper')
+    @patch('git_llm_tool.commands.commit_cmd.get_provider')
+    def test_commit_prints_message_once(
+        self, mock_get_provider, mock_jira_helper, mock_git_helper, mock_get_config,
+        streamed, expected_count, runner
+    ):
+        """Test that the message is printed unless it was already streamed."""
+        from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
+
+        mock_get_config.return_value = AppConfig(llm=LlmConfig(), jira=JiraConfig())
+        mock_git_helper.return_value.get_staged_diff.return_value = "diff"
+        mock_jira_helper.return_value.get_jira_context.return_value = (None, None)
+        mock_provider = Mock()
+        mock_provider.generate_commit_message.return_value = "feat: add feature"
+        mock_provider.last_diff_truncated = False
+        mock_provider.last_response_streamed = streamed
+        mock_get_provider.return_value = mock_provider
+
+        result = runner.invoke(main, ['--verbose', 'commit', '--apply'])
+
+        assert result.exit_code == 0
+        assert result.output.count("feat: add feature") == expected_count
+
 
 class TestChangelogCommand:
     """Test changelog command."""
 
-    def test_changelog_basic(self):
+    def test_changelog_basic(self, runner):
         """Test basic changelog command."""
-        runner = CliRunner()
         result = runner.invoke(main, ['changelog'])
 
         assert result.exit_code == 0
         assert "Generating changelog" in result.output
 
-    def test_changelog_with_options(self):
+    def test_changelog_with_options(self, runner):
         """Test changelog command with options."""
-        runner = CliRunner()
         result = runner.invoke(main, [
             'changelog',
             '--from', 'v1.0.0',
@@ -268,4 +331,76 @@ class TestChangelogCommand:
         ])
 
         assert result.exit_code == 0
-        assert "Generating changelog" in result.output
\ No newline at end of file
+        assert "Generating changelog" in result.output
+
+    @pytest.mark.parametrize("provider_cls", [
+        AnthropicProvider, GeminiProvider, AzureOpenAiProvider
+    ])
+    @patch('git_llm_tool.commands.changelog_cmd.get_config')
+    @patch('git_llm_tool.commands.changelog_cmd.GitHelper')
+    @patch('git_llm_tool.commands.changelog_cmd.get_provider')
+    def test_changelog_batch_rejects_non_openai_provider(
+        self, mock_get_provider, mock_git_helper, mock_get_config, provider_cls, runner
+    ):
+        """Test that --batch is refused for providers without a Batch API."""
+        from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
+
+        mock_get_config.return_value = AppConfig(llm=LlmConfig(), jira=JiraConfig())
+        mock_git_helper.return_value.get_commit_messages.return_value = ["feat: a"]
+        mock_provider = Mock(spec=provider_cls)
+        mock_get_provider.return_value = mock_provider
+
+        result = runner.invoke(main, ['changelog', '--batch'])
+
+        assert result.exit_code == 0
+        assert "Batch mode is only supported with OpenAI models" in result.output
+        mock_provider.generate_changelog.assert_not_called()
+
+    @patch('git_llm_tool.commands.changelog_cmd.get_config')
+    @patch('git_llm_tool.commands.changelog_cmd.GitHelper')
+    @patch('git_llm_tool.commands.changelog_cmd.get_provider')
+    def test_changelog_batch_uses_batch_api(
+        self, mock_get_provider, mock_git_helper, mock_get_config, runner, tmp_path
+    ):
+        """Test that --batch dispatches to the OpenAI Batch API."""
+        from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
+
+        mock_get_config.return_value = AppConfig(llm=LlmConfig(), jira=JiraConfig())
+        mock_git_helper.return_value.get_commit_messages.return_value = ["feat: a", "fix: b"]
+        mock_provider = Mock(spec=OpenAiProvider)
+        mock_provider.generate_changelog_batch.return_value = "## Changelog"
+        mock_get_provider.return_value = mock_provider
+        output = tmp_path / "CHANGELOG.md"
+
+        result = runner.invoke(main, ['changelog', '--batch', '--output', str(output)])
+
+        assert result.exit_code == 0
+        mock_provider.generate_changelog_batch.assert_called_once_with(["feat: a", "fix: b"])
+        mock_provider.generate_changelog.assert_not_called()
+        assert output.read_text(encoding="utf-8") == "## Changelog"
+
+    @patch('git_llm_tool.cli.execute_changelog')
+    def test_changelog_no_cache_option(self, mock_execute, runner):
+        """Test that --no-cache is passed through to the changelog command."""
+        result = runner.invoke(main, ['changelog', '--no-cache'])
+
+        assert result.exit_code == 0
+        assert mock_execute.call_args.kwargs["no_cache"] is True
+
+    @patch('git_llm_tool.commands.changelog_cmd.get_config')
+    @patch('git_llm_tool.commands.changelog_cmd.GitHelper')
+    @patch('git_llm_tool.commands.changelog_cmd.get_provider')
+    def test_changelog_no_cache_disables_response_cache(
+        self, mock_get_provider, mock_git_helper, mock_get_config, runner
+    ):
+        """Test that --no-cache disables the response cache before the provider is built."""
+        from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
+
+        mock_get_config.return_value = AppConfig(llm=LlmConfig(cache_ttl=3600), jira=JiraConfig())
+        mock_git_helper.return_value.get_commit_messages.return_value = ["feat: a"]
+        mock_get_provider.side_effect = ApiError("No API keys configured")
+
+        result = runner.invoke(main, ['changelog', '--no-cache'])
+
+        assert result.exit_code == 0
+        assert mock_get_provider.call_args.args[0].llm.cache_ttl == 0
\ No newline at end of file
@@ -1,15 +1,43 @@
 """Tests for configuration management."""
 
 import pytest
-import tempfile
 import os
-from pathlib import Path
-from unittest.mock import patch, mock_open
+import yaml
+from unittest.mock import patch
 
 from git_llm_tool.core.config import ConfigLoader, AppConfig, LlmConfig, JiraConfig
 from git_llm_tool.core.exceptions import ConfigError
 
 
+FIXTURES = {
+    "full": """
+llm:
+  default_model: claude-3-sonnet
+  language: fr
+  api_keys:
+    openai: sk-yaml-openai
+    anthropic: sk-yaml-anthropic
+
+jira:
+  enabled: true
+  branch_regex: "feature/(JIRA-\\\\d+)-.*"
+""",
+    "hierarchy": """
+llm:
+  default_model: gpt-3.5-turbo
+  language: en
+  api_keys:
+    openai: sk-yaml-key
+
+jira:
+  enabled: false
+""",
+}
+
+# Parsed once so tests only exercise config loading, not YAML parsing
+_YAML_FIXTURES = {name: yaml.safe_load(text) for name, text in FIXTURES.items()}
+
+
 class TestConfigLoader:
     """Test ConfigLoader functionality."""
 
@@ -54,21 +82,8 @@ class TestConfigLoader:
 
     def test_yaml_config_loading(self):
         """Test loading configuration from YAML file."""
-        yaml_content = """
-llm:
-  default_model: claude-3-sonnet
-  language: fr
-  api_keys:
-    openai: sk-yaml-openai
-    anthropic: sk-yaml-anthropic
-
-jira:
-  enabled: true
-  branch_regex: "feature/(JIRA-\\\\d+)-.*"
-"""
-
         with patch('pathlib.Path.exists', return_value=True):
-            with patch('builtins.open', mock_open(read_data=yaml_content)):
+            with patch.object(ConfigLoader, '_load_yaml_file', return_value=_YAML_FIXTURES["full"]):
                 with patch.dict(os.environ, {}, clear=True):
                     loader = ConfigLoader()
                     config = loader.config
@@ -82,24 +97,13 @@ jira:
 
     def test_config_hierarchy(self):
         """Test configuration hierarchy: env vars override file config."""
-        yaml_content = """
-llm:
-  default_model: gpt-3.5-turbo
-  language: en
-  api_keys:
-    openai: sk-yaml-key
-
-jira:
-  enabled: false
-"""
-
         env_vars = {
             'GIT_LLM_MODEL': 'gpt-4-turbo',
             'OPENAI_API_KEY': 'sk-env-key'
         }
 
         with patch('pathlib.Path.exists', return_value=True):
-            with patch('builtins.open', mock_open(read_data=yaml_content)):
+            with patch.object(ConfigLoader, '_load_yaml_file', return_value=_YAML_FIXTURES["hierarchy"]):
                 with patch.dict(os.environ, env_vars, clear=True):
                     loader = ConfigLoader()
                     config = loader.config
@@ -159,20 +163,66 @@ jira:
                     loader.set_value("jira.enabled", false_value)
                     assert loader.get_value("jira.enabled") is False
 
-    def test_invalid_yaml(self):
+    def test_invalid_yaml(self, tmp_path, monkeypatch):
         """Test error handling for invalid YAML."""
-        invalid_yaml = """
-llm:
-  default_model: gpt-4o
-  invalid: yaml: content:
-"""
+        config_file = tmp_path / ".git-llm-tool" / "config.yaml"
+        config_file.parent.mkdir()
+        config_file.write_text(
+            "llm:\n  default_model: gpt-4o\n  invalid: yaml: content:\n",
+            encoding="utf-8"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        with patch('pathlib.Path.home', return_value=tmp_path):
+            with pytest.raises(ConfigError, match="Invalid YAML"):
+                ConfigLoader()
+
+    def test_cache_ttl_from_yaml_string(self, tmp_path, monkeypatch):
+        """Test that a quoted cache TTL in YAML is converted to seconds."""
+        config_file = tmp_path / ".git-llm-tool" / "config.yaml"
+        config_file.parent.mkdir()
+        config_file.write_text('llm:\n  cache_ttl: "3600"\n', encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        with patch('pathlib.Path.home', return_value=tmp_path):
+            loader = ConfigLoader()
+
+        assert loader.config.llm.cache_ttl == 3600
+
+    def test_invalid_cache_ttl(self, tmp_path, monkeypatch):
+        """Test error handling for a non-numeric cache TTL."""
+        config_file = tmp_path / ".git-llm-tool" / "config.yaml"
+        config_file.parent.mkdir()
+        config_file.write_text("llm:\n  cache_ttl: an hour\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        with patch('pathlib.Path.home', return_value=tmp_path):
+            with pytest.raises(ConfigError, match="Invalid cache TTL"):
+                ConfigLoader()
+
+    def test_yaml_file_parsed_once_until_changed(self, tmp_path):
+        """Test that an unchanged config file is not parsed again."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("llm:\n  language: en\n", encoding="utf-8")
 
-        with patch('pathlib.Path.exists', return_value=True):
-            with patch('builtins.open', mock_open(read_data=invalid_yaml)):
-                with pytest.raises(ConfigError, match="Invalid YAML"):
-                    ConfigLoader()
+        with patch('pathlib.Path.exists', return_value=False):
+            loader = ConfigLoader()
+
+        with patch('yaml.load', wraps=yaml.load) as mock_load:
+            first = loader._load_yaml_file(config_file)
+            first["llm"]["language"] = "changed"
+            second = loader._load_yaml_file(config_file)
+
+            assert mock_load.call_count == 1
+            assert second == {"llm": {"language": "en"}}
 
-    def test_save_config(self):
+            config_file.write_text("llm:\n  language: fr\n", encoding="utf-8")
+            os.utime(config_file, ns=(0, 0))
+
+            assert loader._load_yaml_file(config_file) == {"llm": {"language": "fr"}}
+            assert mock_load.call_count == 2
+
+    def test_save_config(self, tmp_path):
         """Test saving configuration to file."""
         with patch('pathlib.Path.exists', return_value=False):
             with patch.dict(os.environ, {}, clear=True):
@@ -181,19 +231,14 @@ llm:
                 loader.set_value("llm.api_keys.openai", "sk-test")
                 loader.set_value("jira.enabled", "true")
 
-                # Mock file operations
-                mock_file = mock_open()
-                with patch('builtins.open', mock_file):
-                    with patch('pathlib.Path.mkdir'):
-                        loader.save_config()
-
-                # Verify file was opened for writing
-                mock_file.assert_called_once()
-                # Verify YAML content was written
-                written_content = ''.join(call.args[0] for call in mock_file().write.call_args_list)
-                assert 'default_model: gpt-4-turbo' in written_content
-                assert 'openai: sk-test' in written_content
-                assert 'enabled: true' in written_content
+        config_path = tmp_path / ".git-llm-tool" / "config.yaml"
+        loader.save_config(config_path)
+
+        # Verify YAML content was written
+        written_content = config_path.read_text(encoding="utf-8")
+        assert 'default_model: gpt-4-turbo' in written_content
+        assert 'openai: sk-test' in written_content
+        assert 'enabled: true' in written_content
 
     def test_singleton_behavior(self):
         """Test that ConfigLoader is a singleton."""
@@ -1,17 +1,70 @@
 """Tests for Git helper functionality."""
 
+import re
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 import subprocess
+from types import SimpleNamespace
 
 from git_llm_tool.core.git_helper import GitHelper
 from git_llm_tool.core.exceptions import GitError
 
+DIFF_SAMPLE = "diff --git a/file.py b/file.py\\n+new line"
+
+# Expected GitError messages
+RE_NOT_A_REPOSITORY = re.compile("Not in a git repository")
+RE_GIT_NOT_FOUND = re.compile("Git command not found")
+RE_COMMAND_FAILED = re.compile("Git command failed")
+RE_NO_STAGED_CHANGES = re.compile("No staged changes found")
+RE_NOTHING_TO_COMMIT = re.compile("No staged changes to commit")
+
+
+def assert_git_call(mock_run, index, argv):
+    """Assert the git argv of one recorded subprocess.run call and return the call."""
+    call = mock_run.call_args_list[index]
+    assert list(call.args[0]) == list(argv), call.args[0]
+    return call
+
+
+def fake_run_dispatcher(table):
+    """Build a subprocess.run replacement that answers git commands from a table.
+
+    Keys are the git arguments without the leading "git"; values are the
+    stdout to return or an exception to raise.
+    """
+    def _run(command, **kwargs):
+        result = table[tuple(command[1:])]
+        if isinstance(result, Exception):
+            raise result
+        return SimpleNamespace(stdout=result, returncode=0)
+
+    return _run
+
+
+@pytest.fixture(autouse=True)
+def mock_run(monkeypatch):
+    """Replace subprocess.run in the git helper for every test."""
+    run = MagicMock()
+    monkeypatch.setattr('git_llm_tool.core.git_helper.subprocess.run', run)
+    return run
+
+
+@pytest.fixture
+def git_helper_mocked(mock_run):
+    """GitHelper constructed against the mocked subprocess.run.
+
+    The repository check is already consumed and the mock is reset, so
+    tests only set up the git calls they exercise.
+    """
+    mock_run.return_value = MagicMock(stdout=".git", returncode=0)
+    helper = GitHelper()
+    mock_run.reset_mock(return_value=True)
+    return helper, mock_run
+
 
 class TestGitHelper:
     """Test GitHelper functionality."""
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
     def test_verify_git_repo_success(self, mock_run):
         """Test successful git repository verification."""
         mock_run.return_value = MagicMock(
@@ -23,132 +76,91 @@ class TestGitHelper:
         helper = GitHelper()
         assert helper is not None
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_verify_git_repo_failure(self, mock_run):
-        """Test git repository verification failure."""
-        mock_run.side_effect = subprocess.CalledProcessError(
-            128, ['git', 'rev-parse', '--git-dir'], stderr="Not a git repository"
-        )
-
-        with pytest.raises(GitError, match="Not in a git repository"):
-            GitHelper()
-
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_get_staged_diff_success(self, mock_run):
+    def test_get_staged_diff_success(self, git_helper_mocked):
         """Test getting staged diff successfully."""
-        # Mock initial git repo check
+        helper, mock_run = git_helper_mocked
         mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
-            MagicMock(stdout="diff --git a/file.py b/file.py\\n+new line", returncode=0)  # diff
+            MagicMock(stdout=DIFF_SAMPLE, returncode=0)  # diff
         ]
 
-        helper = GitHelper()
         diff = helper.get_staged_diff()
 
-        assert diff == "diff --git a/file.py b/file.py\\n+new line"
-        mock_run.assert_called_with(
-            ["git", "diff", "--cached"],
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=mock_run.call_args[1]['cwd']
-        )
+        assert diff == DIFF_SAMPLE
+        call = assert_git_call(mock_run, -1, ["git", "diff", "--cached"])
+        assert call.kwargs["capture_output"] is True
+        assert call.kwargs["text"] is True
+        assert call.kwargs["check"] is True
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_get_staged_diff_no_changes(self, mock_run):
+    def test_get_staged_diff_no_changes(self, git_helper_mocked):
         """Test getting staged diff with no changes."""
+        helper, mock_run = git_helper_mocked
         mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
             MagicMock(stdout="", returncode=0)  # empty diff
         ]
 
-        helper = GitHelper()
-
-        with pytest.raises(GitError, match="No staged changes found"):
+        with pytest.raises(GitError, match=RE_NO_STAGED_CHANGES):
             helper.get_staged_diff()
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_get_current_branch(self, mock_run):
+    def test_get_current_branch(self, git_helper_mocked):
         """Test getting current branch name."""
+        helper, mock_run = git_helper_mocked
         mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
             MagicMock(stdout="feature/test-branch", returncode=0)  # branch name
         ]
 
-        helper = GitHelper()
         branch = helper.get_current_branch()
 
         assert branch == "feature/test-branch"
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_get_commit_messages_with_tag(self, mock_run):
+    def test_get_commit_messages_with_tag(self, git_helper_mocked):
         """Test getting commit messages from last tag."""
-        mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
-            MagicMock(stdout="v1.0.0", returncode=0),  # last tag
-            MagicMock(stdout="feat: add new feature\\nfix: bug fix\\nchore: update deps", returncode=0)  # log
-        ]
+        helper, mock_run = git_helper_mocked
+        mock_run.side_effect = fake_run_dispatcher({
+            ("describe", "--tags", "--abbrev=0"): "v1.0.0",
+            ("log", "v1.0.0..HEAD", "--pretty=format:%s"):
+                "feat: add new feature\\nfix: bug fix\\nchore: update deps",
+        })
 
-        helper = GitHelper()
         messages = helper.get_commit_messages()
 
         assert messages == ["feat: add new feature", "fix: bug fix", "chore: update deps"]
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_get_commit_messages_no_tags(self, mock_run):
+    def test_get_commit_messages_no_tags(self, git_helper_mocked):
         """Test getting commit messages when no tags exist."""
-        mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
-            subprocess.CalledProcessError(128, ['git', 'describe'], stderr="No tags"),  # no tags
-            MagicMock(stdout="abc123", returncode=0),  # initial commit
-            MagicMock(stdout="feat: initial commit\\nfeat: add feature", returncode=0)  # log
-        ]
+        helper, mock_run = git_helper_mocked
+        mock_run.side_effect = fake_run_dispatcher({
+            ("describe", "--tags", "--abbrev=0"):
+                subprocess.CalledProcessError(128, ['git', 'describe'], stderr="No tags"),
+            ("rev-list", "--max-parents=0", "HEAD"): "abc123",
+            ("log", "abc123..HEAD", "--pretty=format:%s"): "feat: initial commit\\nfeat: add feature",
+        })
 
-        helper = GitHelper()
         messages = helper.get_commit_messages()
 
         assert messages == ["feat: initial commit", "feat: add feature"]
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_commit_with_message(self, mock_run):
+    def test_commit_with_message(self, git_helper_mocked):
         """Test creating commit with message."""
+        helper, mock_run = git_helper_mocked
         mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
             MagicMock(stdout="", returncode=0)  # commit
         ]
 
-        helper = GitHelper()
         helper.commit_with_message("test commit message")
 
         # Verify commit command was called
-        commit_call = mock_run.call_args_list[1]
-        assert commit_call[0][0] == ["git", "commit", "-m", "test commit message"]
-
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_commit_with_message_nothing_to_commit(self, mock_run):
-        """Test commit failure when nothing to commit."""
-        mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
-            subprocess.CalledProcessError(1, ['git', 'commit'], stderr="nothing to commit")
-        ]
+        assert_git_call(mock_run, 0, ["git", "commit", "-m", "test commit message"])
 
-        helper = GitHelper()
-
-        with pytest.raises(GitError, match="No staged changes to commit"):
-            helper.commit_with_message("test message")
-
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_get_repository_info(self, mock_run):
+    def test_get_repository_info(self, git_helper_mocked):
         """Test getting repository information."""
-        mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
-            MagicMock(stdout="main", returncode=0),  # current branch
-            MagicMock(stdout="file1.py\\nfile2.py", returncode=0),  # staged changes
-            MagicMock(stdout="file3.py", returncode=0),  # unstaged changes
-            MagicMock(stdout="/path/to/repo", returncode=0)  # repo root
-        ]
+        helper, mock_run = git_helper_mocked
+        mock_run.side_effect = fake_run_dispatcher({
+            ("symbolic-ref", "--short", "HEAD"): "main",
+            ("diff", "--cached", "--name-only"): "file1.py\\nfile2.py",
+            ("diff", "--name-only"): "file3.py",
+            ("rev-parse", "--show-toplevel"): "/path/to/repo",
+        })
 
-        helper = GitHelper()
         info = helper.get_repository_info()
 
         expected = {
@@ -160,53 +172,64 @@ class TestGitHelper:
 
         assert info == expected
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_is_clean_workspace(self, mock_run):
+    def test_is_clean_workspace(self, git_helper_mocked):
         """Test checking if workspace is clean."""
-        mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
-            MagicMock(stdout="", returncode=0),  # no staged changes
-            MagicMock(stdout="", returncode=0),  # no unstaged changes
-            MagicMock(stdout="", returncode=0)   # no untracked files
-        ]
+        helper, mock_run = git_helper_mocked
+        mock_run.side_effect = fake_run_dispatcher({
+            ("diff", "--cached", "--name-only"): "",
+            ("diff", "--name-only"): "",
+            ("ls-files", "--others", "--exclude-standard"): "",
+        })
 
-        helper = GitHelper()
         is_clean = helper.is_clean_workspace()
 
         assert is_clean is True
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_is_dirty_workspace(self, mock_run):
+    def test_is_dirty_workspace(self, git_helper_mocked):
         """Test checking workspace with uncommitted changes."""
-        mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
-            MagicMock(stdout="staged_file.py", returncode=0),  # staged changes
-            MagicMock(stdout="", returncode=0),  # no unstaged changes
-            MagicMock(stdout="", returncode=0)   # no untracked files
-        ]
+        helper, mock_run = git_helper_mocked
+        mock_run.side_effect = fake_run_dispatcher({
+            ("diff", "--cached", "--name-only"): "staged_file.py",
+            ("diff", "--name-only"): "",
+            ("ls-files", "--others", "--exclude-standard"): "",
+        })
 
-        helper = GitHelper()
         is_clean = helper.is_clean_workspace()
 
         assert is_clean is False
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_git_command_not_found(self, mock_run):
-        """Test error when git command is not found."""
-        mock_run.side_effect = FileNotFoundError("git command not found")
-
-        with pytest.raises(GitError, match="Git command not found"):
+    @pytest.mark.parametrize("side_effect, match", [
+        (
+            subprocess.CalledProcessError(
+                128, ['git', 'rev-parse', '--git-dir'], stderr="Not a git repository"
+            ),
+            RE_NOT_A_REPOSITORY,
+        ),
+        (FileNotFoundError("git command not found"), RE_GIT_NOT_FOUND),
+    ], ids=["not_a_repository", "git_not_found"])
+    def test_init_errors(self, mock_run, side_effect, match):
+        """Test errors raised while verifying the git repository."""
+        mock_run.side_effect = side_effect
+
+        with pytest.raises(GitError, match=match):
             GitHelper()
 
-    @patch('git_llm_tool.core.git_helper.subprocess.run')
-    def test_git_command_error(self, mock_run):
-        """Test handling of git command errors."""
-        mock_run.side_effect = [
-            MagicMock(stdout=".git", returncode=0),  # repo verification
-            subprocess.CalledProcessError(1, ['git', 'diff'], stderr="Permission denied")
-        ]
-
-        helper = GitHelper()
-
-        with pytest.raises(GitError, match="Git command failed"):
-            helper.get_staged_diff()
\ No newline at end of file
+    @pytest.mark.parametrize("method, args, side_effect, match", [
+        (
+            "get_staged_diff", (),
+            subprocess.CalledProcessError(1, ['git', 'diff'], stderr="Permission denied"),
+            RE_COMMAND_FAILED,
+        ),
+        (
+            "commit_with_message", ("test message",),
+            subprocess.CalledProcessError(1, ['git', 'commit'], stderr="nothing to commit"),
+            RE_NOTHING_TO_COMMIT,
+        ),
+    ], ids=["command_failed", "nothing_to_commit"])
+    def test_command_errors(self, git_helper_mocked, method, args, side_effect, match):
+        """Test errors raised by failing git commands."""
+        helper, mock_run = git_helper_mocked
+        mock_run.side_effect = side_effect
+
+        with pytest.raises(GitError, match=match):
+            getattr(helper, method)(*args)
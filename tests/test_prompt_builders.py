@@ -0,0 +1,109 @@
+"""Tests for prompt building in the base LLM provider.
+
+These tests only exercise string assembly, so they need no SDK clients
+or subprocess mocks.
+"""
+
+from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
+
+DIFF_SAMPLE = "diff --git a/file.py b/file.py\\n+new line"
+COMMITS_SAMPLE = ("feat: add feature", "fix: bug fix", "docs: update readme")
+
+
+class TestPromptBuilders:
+    """Test commit and changelog prompt construction."""
+
+    def test_build_commit_prompt_basic(self, stub_provider):
+        """Test building basic commit prompt."""
+        config = AppConfig(
+            llm=LlmConfig(language="en"),
+            jira=JiraConfig()
+        )
+
+        provider = stub_provider(config)
+
+        prompt = provider._build_commit_prompt(DIFF_SAMPLE)
+
+        assert "git diff" in prompt
+        assert "conventional commit format" in prompt
+        assert DIFF_SAMPLE in prompt
+        assert "en" in prompt
+
+    def test_build_commit_prompt_with_jira(self, stub_provider):
+        """Test building commit prompt with Jira information."""
+        config = AppConfig(
+            llm=LlmConfig(language="zh-TW"),
+            jira=JiraConfig()
+        )
+
+        provider = stub_provider(config)
+        diff = "test diff"
+
+        prompt = provider._build_commit_prompt(
+            diff,
+            jira_ticket="PROJ-123",
+            work_hours="2h 30m"
+        )
+
+        assert "PROJ-123" in prompt
+        assert "2h 30m" in prompt
+        assert "zh-TW" in prompt
+
+    def test_build_commit_prompt_truncates_large_diff(self, stub_provider):
+        """Test that oversized diffs keep only their head and tail."""
+        config = AppConfig(
+            llm=LlmConfig(language="en"),
+            jira=JiraConfig()
+        )
+
+        provider = stub_provider(config)
+        provider.MAX_DIFF_TOKENS = 10
+        diff = "HEAD" + "x" * 100 + "TAIL"
+
+        prompt = provider._build_commit_prompt(diff)
+
+        assert "HEAD" in prompt
+        assert "TAIL" in prompt
+        assert "[truncated 78 characters]" in prompt
+        assert diff not in prompt
+        assert provider.last_diff_truncated is True
+
+        provider._build_commit_prompt("small diff")
+        assert provider.last_diff_truncated is False
+
+    def test_diff_budget_depends_on_model(self, stub_provider):
+        """Test that the diff budget follows the model's context window."""
+        config = AppConfig(
+            llm=LlmConfig(language="en"),
+            jira=JiraConfig()
+        )
+
+        provider = stub_provider(config)
+        budgets = {}
+        for model in ["gpt-4o-mini", "gpt-4", "gpt-3.5-turbo", "claude-3-5-sonnet", "my-deployment"]:
+            provider.model = model
+            budgets[model] = provider._max_diff_tokens()
+
+        assert budgets["gpt-4o-mini"] == 100_000
+        assert budgets["gpt-4"] == 6_000
+        assert budgets["gpt-3.5-turbo"] == 12_000
+        assert budgets["claude-3-5-sonnet"] == 150_000
+        assert budgets["my-deployment"] == provider.DEFAULT_DIFF_TOKENS
+
+    def test_build_changelog_prompt(self, stub_provider):
+        """Test building changelog prompt."""
+        config = AppConfig(
+            llm=LlmConfig(language="fr"),
+            jira=JiraConfig()
+        )
+
+        provider = stub_provider(config)
+
+        prompt = provider._build_changelog_prompt(COMMITS_SAMPLE)
+
+        assert "changelog" in prompt.lower()
+        assert "features" in prompt.lower()
+        assert "bug fixes" in prompt.lower()
+        assert "fr" in prompt
+        for commit in COMMITS_SAMPLE:
+            assert commit in prompt
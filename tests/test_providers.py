@@ -1,135 +1,169 @@
 """Tests for LLM providers."""
 
+import anthropic
+import google.generativeai as genai
+import openai
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, MagicMock, call
 
 from git_llm_tool.core.config import AppConfig, LlmConfig, JiraConfig
 from git_llm_tool.core.exceptions import ApiError
-from git_llm_tool.providers.base import LlmProvider
-from git_llm_tool.providers.openai import OpenAiProvider
+from git_llm_tool.providers.openai import OpenAiProvider, _get_sync_client
 from git_llm_tool.providers.anthropic import AnthropicProvider
+from git_llm_tool.providers.azure_openai import AzureOpenAiProvider
 from git_llm_tool.providers.gemini import GeminiProvider
 from git_llm_tool.providers.factory import get_provider
+from git_llm_tool.providers._http import get_shared_httpx_client
+
+DIFF_SAMPLE = "test diff"
+
+# Real SDK classes captured before any test patches them, used as mock specs
+_OPENAI_CLIENT = openai.OpenAI
+_GEMINI_MODEL = genai.GenerativeModel
 
 
 class TestLlmProviderBase:
     """Test base LLM provider functionality."""
 
-    def test_build_commit_prompt_basic(self):
-        """Test building basic commit prompt."""
+    def test_generate_changelog_batches_long_ranges(self, stub_provider):
+        """Test that long commit ranges are split into batches and merged."""
         config = AppConfig(
             llm=LlmConfig(language="en"),
             jira=JiraConfig()
         )
 
-        class TestProvider(LlmProvider):
-            def generate_commit_message(self, diff, **kwargs):
-                return ""
-
-            def generate_changelog(self, commit_messages, **kwargs):
-                return ""
-
-            def _make_api_call(self, prompt, **kwargs):
-                return ""
+        provider = stub_provider(config)
+        provider.CHANGELOG_BATCH_SIZE = 2
+        commits = ["feat: a", "fix: b", "docs: c", "chore: d", "test: e"]
 
-        provider = TestProvider(config)
-        diff = "diff --git a/file.py b/file.py\\n+new line"
+        result = provider.generate_changelog(commits)
 
-        prompt = provider._build_commit_prompt(diff)
-
-        assert "git diff" in prompt
-        assert "conventional commit format" in prompt
-        assert diff in prompt
-        assert "en" in prompt
+        # Three batch calls plus one merge call
+        assert len(provider.prompts) == 4
+        merge_prompt = provider.prompts[-1]
+        assert "Merge the following partial changelogs" in merge_prompt
+        assert result == "response 4"
+        batch_prompts = provider.prompts[:-1]
+        for commit in commits:
+            assert sum(commit in prompt for prompt in batch_prompts) == 1
 
-    def test_build_commit_prompt_with_jira(self):
-        """Test building commit prompt with Jira information."""
+    def test_call_api_reuses_cached_response(self, stub_provider, tmp_path):
+        """Test that identical prompts are served from the response cache."""
         config = AppConfig(
-            llm=LlmConfig(language="zh-TW"),
+            llm=LlmConfig(language="en", cache_ttl=3600),
             jira=JiraConfig()
         )
 
-        class TestProvider(LlmProvider):
-            def generate_commit_message(self, diff, **kwargs):
-                return ""
+        with patch('pathlib.Path.home', return_value=tmp_path):
+            provider = stub_provider(config)
 
-            def generate_changelog(self, commit_messages, **kwargs):
-                return ""
+        with patch.object(provider, '_make_api_call', wraps=provider._make_api_call) as mock_call:
+            first = provider._call_api("same prompt", max_tokens=150)
+            second = provider._call_api("same prompt", max_tokens=150)
+            provider._call_api("other prompt", max_tokens=150)
 
-            def _make_api_call(self, prompt, **kwargs):
-                return ""
+        assert first == second == "response 1"
+        assert mock_call.call_count == 2
 
-        provider = TestProvider(config)
-        diff = "test diff"
-
-        prompt = provider._build_commit_prompt(
-            diff,
-            jira_ticket="PROJ-123",
-            work_hours="2h 30m"
-        )
-
-        assert "PROJ-123" in prompt
-        assert "2h 30m" in prompt
-        assert "zh-TW" in prompt
-
-    def test_build_changelog_prompt(self):
-        """Test building changelog prompt."""
+    def test_cached_response_is_not_reported_as_streamed(self, stub_provider, tmp_path):
+        """Test that a response served from the cache is not marked as streamed."""
         config = AppConfig(
-            llm=LlmConfig(language="fr"),
+            llm=LlmConfig(language="en", cache_ttl=3600),
             jira=JiraConfig()
         )
 
-        class TestProvider(LlmProvider):
-            def generate_commit_message(self, diff, **kwargs):
-                return ""
-
-            def generate_changelog(self, commit_messages, **kwargs):
-                return ""
-
-            def _make_api_call(self, prompt, **kwargs):
-                return ""
+        with patch('pathlib.Path.home', return_value=tmp_path):
+            provider = stub_provider(config)
 
-        provider = TestProvider(config)
-        commits = ["feat: add feature", "fix: bug fix", "docs: update readme"]
-
-        prompt = provider._build_changelog_prompt(commits)
-
-        assert "changelog" in prompt.lower()
-        assert "features" in prompt.lower()
-        assert "bug fixes" in prompt.lower()
-        assert "fr" in prompt
-        for commit in commits:
-            assert commit in prompt
+        provider._call_api("same prompt", stream=True)
+        provider.last_response_streamed = True
+        provider._call_api("same prompt", stream=True)
 
+        assert provider.last_response_streamed is False
+        assert len(provider.prompts) == 1
 
-class TestOpenAiProvider:
-    """Test OpenAI provider."""
-
-    def test_init_success(self):
-        """Test successful OpenAI provider initialization."""
+    def test_call_api_cache_is_keyed_on_model(self, stub_provider, tmp_path):
+        """Test that a different resolved model does not reuse a cached response."""
         config = AppConfig(
-            llm=LlmConfig(
-                default_model="gpt-4o",
-                api_keys={"openai": "sk-test-key"}
-            ),
+            llm=LlmConfig(language="en", cache_ttl=3600),
             jira=JiraConfig()
         )
 
-        with patch('openai.OpenAI') as mock_openai:
-            provider = OpenAiProvider(config)
+        with patch('pathlib.Path.home', return_value=tmp_path):
+            provider = stub_provider(config)
+
+        provider.model = "model-a"
+        first = provider._call_api("same prompt", max_tokens=150)
+        provider.model = "model-b"
+        second = provider._call_api("same prompt", max_tokens=150)
+
+        assert first == "response 1"
+        assert second == "response 2"
+
+
+# (provider class, SDK module, client constructor, api key name, model, api key, expected model)
+PROVIDER_CASES = [
+    (OpenAiProvider, openai, "OpenAI", "openai", "gpt-4o", "sk-test-key", "gpt-4o"),
+    (
+        AnthropicProvider, anthropic, "Anthropic", "anthropic", "claude-3-5-sonnet-20241024",
+        "sk-ant-test-key", "claude-3-5-sonnet-20241024",
+    ),
+    (
+        GeminiProvider, genai, "GenerativeModel", "google", "gemini-1.5-pro",
+        "test-google-key", "gemini-1.5-pro",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "provider_cls, sdk_module, client_name, key_name, model, api_key, expected_model",
+    PROVIDER_CASES
+)
+def test_provider_init_success(
+    provider_cls, sdk_module, client_name, key_name, model, api_key, expected_model
+):
+    """Test successful provider initialization for each provider."""
+    _get_sync_client.cache_clear()
+    config = AppConfig(
+        llm=LlmConfig(default_model=model, api_keys={key_name: api_key}),
+        jira=JiraConfig()
+    )
+
+    with patch.object(genai, 'configure') as mock_configure:
+        with patch.object(sdk_module, client_name) as mock_client:
+            provider = provider_cls(config)
+
+    if provider_cls is GeminiProvider:
+        # Gemini passes its key through genai.configure instead of a client
+        mock_configure.assert_called_once_with(api_key=api_key)
+        assert mock_client.call_args_list == [call(expected_model)]
+        assert provider.model is mock_client.return_value
+        assert provider.model_name == expected_model
+    else:
+        assert mock_client.call_args_list == [
+            call(api_key=api_key, http_client=get_shared_httpx_client())
+        ]
+        assert provider.model == expected_model
+
+
+@pytest.mark.parametrize("provider_cls, match", [
+    (OpenAiProvider, "OpenAI API key not found"),
+    (AnthropicProvider, "Anthropic API key not found"),
+    (GeminiProvider, "Google API key not found"),
+])
+def test_provider_init_no_api_key(provider_cls, match, no_api_key_config):
+    """Test provider initialization without API key."""
+    with pytest.raises(ApiError, match=match):
+        provider_cls(no_api_key_config)
 
-            assert provider.model == "gpt-4o"
-            mock_openai.assert_called_once_with(api_key="sk-test-key")
 
-    def test_init_no_api_key(self):
-        """Test OpenAI provider initialization without API key."""
-        config = AppConfig(
-            llm=LlmConfig(default_model="gpt-4o", api_keys={}),
-            jira=JiraConfig()
-        )
+class TestOpenAiProvider:
+    """Test OpenAI provider."""
 
-        with pytest.raises(ApiError, match="OpenAI API key not found"):
-            OpenAiProvider(config)
+    def setup_method(self):
+        """Clear cached OpenAI clients so each test sees its own mock."""
+        _get_sync_client.cache_clear()
 
     def test_model_fallback(self):
         """Test model fallback for non-OpenAI models."""
@@ -141,157 +175,197 @@ class TestOpenAiProvider:
             jira=JiraConfig()
         )
 
-        with patch('openai.OpenAI'):
+        with patch.object(openai, 'OpenAI'):
             provider = OpenAiProvider(config)
             assert provider.model == "gpt-4o"  # fallback
 
-    @patch('openai.OpenAI')
-    def test_generate_commit_message_success(self, mock_openai):
+    def test_client_reused_across_instances(self, openai_config):
+        """Test that providers with the same API key share one client."""
+        with patch.object(openai, 'OpenAI') as mock_openai:
+            first = OpenAiProvider(openai_config)
+            second = OpenAiProvider(openai_config)
+
+            assert first.client is second.client
+            mock_openai.assert_called_once()
+
+    @patch.object(openai, 'OpenAI')
+    def test_generate_commit_message_success(self, mock_openai, openai_config):
         """Test successful commit message generation."""
         # Setup mock response
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = "feat: add new feature"
+        mock_response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="feat: add new feature"))]
+        )
 
-        mock_client = Mock()
+        mock_client = Mock(spec_set=_OPENAI_CLIENT)
         mock_client.chat.completions.create.return_value = mock_response
         mock_openai.return_value = mock_client
 
-        config = AppConfig(
-            llm=LlmConfig(api_keys={"openai": "sk-test-key"}),
-            jira=JiraConfig()
-        )
-
-        provider = OpenAiProvider(config)
-        result = provider.generate_commit_message("test diff")
+        provider = OpenAiProvider(openai_config)
+        result = provider.generate_commit_message(DIFF_SAMPLE)
 
         assert result == "feat: add new feature"
         mock_client.chat.completions.create.assert_called_once()
 
-    @patch('openai.OpenAI')
-    def test_api_error_handling(self, mock_openai):
-        """Test API error handling."""
-        import openai
+    @patch.object(openai, 'OpenAI')
+    def test_generate_commit_message_stream(self, mock_openai, capsys, openai_config):
+        """Test streamed commit message generation."""
+        chunks = []
+        for delta in ["feat: ", "add ", "streaming", None]:
+            chunks.append(
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+            )
+
+        mock_client = Mock(spec_set=_OPENAI_CLIENT)
+        mock_client.chat.completions.create.return_value = iter(chunks)
+        mock_openai.return_value = mock_client
 
-        mock_client = Mock()
-        mock_client.chat.completions.create.side_effect = openai.AuthenticationError("Invalid API key")
+        provider = OpenAiProvider(openai_config)
+        result = provider.generate_commit_message(DIFF_SAMPLE, stream=True)
+
+        assert result == "feat: add streaming"
+        assert "feat: add streaming" in capsys.readouterr().out
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+        assert provider.last_response_streamed is True
+
+    @patch('git_llm_tool.providers.openai.time.sleep')
+    @patch.object(openai, 'OpenAI')
+    def test_generate_changelog_batch(self, mock_openai, mock_sleep, openai_config):
+        """Test changelog generation through the Batch API."""
+        import json
+
+        mock_client = Mock(spec_set=_OPENAI_CLIENT)
+        mock_client.files.create.return_value = SimpleNamespace(id="file-in")
+        mock_client.batches.create.return_value = SimpleNamespace(id="batch-1", status="in_progress")
+        mock_client.batches.retrieve.return_value = SimpleNamespace(
+            id="batch-1", status="completed", output_file_id="file-out"
+        )
+        result_line = {
+            "custom_id": "0",
+            "response": {"body": {"choices": [{"message": {"content": " ## Changelog "}}]}},
+        }
+        mock_client.files.content.return_value = SimpleNamespace(text=json.dumps(result_line))
         mock_openai.return_value = mock_client
 
-        config = AppConfig(
-            llm=LlmConfig(api_keys={"openai": "sk-test-key"}),
-            jira=JiraConfig()
+        provider = OpenAiProvider(openai_config)
+        result = provider.generate_changelog_batch(["feat: add feature"])
+
+        assert result == "## Changelog"
+        mock_client.batches.create.assert_called_once_with(
+            input_file_id="file-in",
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
         )
+        mock_sleep.assert_called_once()
+
+    @patch('git_llm_tool.providers.openai.time.sleep')
+    @patch.object(openai, 'OpenAI')
+    def test_generate_changelog_batch_failed(self, mock_openai, mock_sleep, openai_config):
+        """Test that a failed batch raises ApiError."""
+        mock_client = Mock(spec_set=_OPENAI_CLIENT)
+        mock_client.files.create.return_value = SimpleNamespace(id="file-in")
+        mock_client.batches.create.return_value = SimpleNamespace(
+            id="batch-1", status="failed", output_file_id=None
+        )
+        mock_openai.return_value = mock_client
 
-        provider = OpenAiProvider(config)
+        provider = OpenAiProvider(openai_config)
 
-        with pytest.raises(ApiError, match="Invalid OpenAI API key"):
-            provider.generate_commit_message("test diff")
+        with pytest.raises(ApiError, match="ended with status 'failed'"):
+            provider.generate_changelog_batch(["feat: add feature"])
 
+    @patch.object(openai, 'OpenAI')
+    def test_empty_response(self, mock_openai, openai_config):
+        """Test that a response without content raises ApiError."""
+        mock_response = SimpleNamespace(choices=[])
 
-class TestAnthropicProvider:
-    """Test Anthropic provider."""
+        mock_client = Mock(spec_set=_OPENAI_CLIENT)
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai.return_value = mock_client
 
-    def test_init_success(self):
-        """Test successful Anthropic provider initialization."""
-        config = AppConfig(
-            llm=LlmConfig(
-                default_model="claude-3-5-sonnet-20241024",
-                api_keys={"anthropic": "sk-ant-test-key"}
-            ),
-            jira=JiraConfig()
-        )
+        provider = OpenAiProvider(openai_config)
 
-        with patch('anthropic.Anthropic') as mock_anthropic:
-            provider = AnthropicProvider(config)
+        with pytest.raises(ApiError, match="Empty response from OpenAI API"):
+            provider.generate_commit_message(DIFF_SAMPLE)
 
-            assert provider.model == "claude-3-5-sonnet-20241024"
-            mock_anthropic.assert_called_once_with(api_key="sk-ant-test-key")
+    @patch.object(openai, 'OpenAI')
+    def test_api_error_handling(self, mock_openai, openai_config):
+        """Test API error handling."""
+        mock_client = Mock(spec_set=_OPENAI_CLIENT)
+        mock_client.chat.completions.create.side_effect = openai.AuthenticationError("Invalid API key")
+        mock_openai.return_value = mock_client
 
-    def test_init_no_api_key(self):
-        """Test Anthropic provider initialization without API key."""
-        config = AppConfig(
-            llm=LlmConfig(default_model="claude-3-sonnet", api_keys={}),
-            jira=JiraConfig()
-        )
+        provider = OpenAiProvider(openai_config)
+
+        with pytest.raises(ApiError, match="Invalid OpenAI API key"):
+            provider.generate_commit_message(DIFF_SAMPLE)
 
-        with pytest.raises(ApiError, match="Anthropic API key not found"):
-            AnthropicProvider(config)
 
-    @patch('anthropic.Anthropic')
-    def test_generate_commit_message_success(self, mock_anthropic):
+class TestAnthropicProvider:
+    """Test Anthropic provider."""
+
+    @patch.object(anthropic, 'Anthropic')
+    def test_generate_commit_message_success(self, mock_anthropic, anthropic_config):
         """Test successful commit message generation."""
         # Setup mock response
-        mock_content = Mock()
-        mock_content.text = "fix: resolve authentication issue"
-
-        mock_response = Mock()
-        mock_response.content = [mock_content]
+        mock_response = SimpleNamespace(
+            content=[SimpleNamespace(text="fix: resolve authentication issue")]
+        )
 
         mock_client = Mock()
         mock_client.messages.create.return_value = mock_response
         mock_anthropic.return_value = mock_client
 
-        config = AppConfig(
-            llm=LlmConfig(api_keys={"anthropic": "sk-ant-test-key"}),
-            jira=JiraConfig()
-        )
-
-        provider = AnthropicProvider(config)
-        result = provider.generate_commit_message("test diff")
+        provider = AnthropicProvider(anthropic_config)
+        result = provider.generate_commit_message(DIFF_SAMPLE)
 
         assert result == "fix: resolve authentication issue"
         mock_client.messages.create.assert_called_once()
 
 
-class TestGeminiProvider:
-    """Test Gemini provider."""
+class TestAzureOpenAiProvider:
+    """Test Azure OpenAI provider."""
 
-    def test_init_success(self):
-        """Test successful Gemini provider initialization."""
+    def test_diff_budget_uses_model_behind_deployment(self):
+        """Test that a custom deployment name keeps the model's diff budget."""
         config = AppConfig(
             llm=LlmConfig(
-                default_model="gemini-1.5-pro",
-                api_keys={"google": "test-google-key"}
+                default_model="gpt-4o",
+                api_keys={"azure_openai": "azure-test-key"},
+                azure_openai={
+                    "endpoint": "https://example.openai.azure.com",
+                    "deployment_name": "prod-chat",
+                },
             ),
             jira=JiraConfig()
         )
 
-        with patch('google.generativeai.configure') as mock_configure:
-            with patch('google.generativeai.GenerativeModel') as mock_model:
-                provider = GeminiProvider(config)
+        with patch.object(openai, 'AzureOpenAI'):
+            provider = get_provider(config)
 
-                mock_configure.assert_called_once_with(api_key="test-google-key")
-                mock_model.assert_called_once_with("gemini-1.5-pro")
+        assert isinstance(provider, AzureOpenAiProvider)
+        assert provider.model_name == "prod-chat"
+        assert provider._max_diff_tokens() == 100_000
 
-    def test_init_no_api_key(self):
-        """Test Gemini provider initialization without API key."""
-        config = AppConfig(
-            llm=LlmConfig(default_model="gemini-pro", api_keys={}),
-            jira=JiraConfig()
-        )
+        diff = "x" * 24_000
+        assert diff in provider._build_commit_prompt(diff)
 
-        with pytest.raises(ApiError, match="Google API key not found"):
-            GeminiProvider(config)
 
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    def test_generate_commit_message_success(self, mock_model_class, mock_configure):
+class TestGeminiProvider:
+    """Test Gemini provider."""
+
+    @patch.object(genai, 'configure')
+    @patch.object(genai, 'GenerativeModel')
+    def test_generate_commit_message_success(self, mock_model_class, mock_configure, gemini_config):
         """Test successful commit message generation."""
         # Setup mock response
-        mock_response = Mock()
-        mock_response.text = "chore: update dependencies"
+        mock_response = SimpleNamespace(text="chore: update dependencies")
 
-        mock_model = Mock()
+        mock_model = Mock(spec_set=_GEMINI_MODEL)
         mock_model.generate_content.return_value = mock_response
         mock_model_class.return_value = mock_model
 
-        config = AppConfig(
-            llm=LlmConfig(api_keys={"google": "test-google-key"}),
-            jira=JiraConfig()
-        )
-
-        provider = GeminiProvider(config)
-        result = provider.generate_commit_message("test diff")
+        provider = GeminiProvider(gemini_config)
+        result = provider.generate_commit_message(DIFF_SAMPLE)
 
         assert result == "chore: update dependencies"
         mock_model.generate_content.assert_called_once()
@@ -300,47 +374,27 @@ class TestGeminiProvider:
 class TestProviderFactory:
     """Test provider factory."""
 
-    def test_get_openai_provider(self):
-        """Test getting OpenAI provider."""
-        config = AppConfig(
-            llm=LlmConfig(
-                default_model="gpt-4o",
-                api_keys={"openai": "sk-test-key"}
-            ),
-            jira=JiraConfig()
-        )
+    def setup_method(self):
+        """Clear cached OpenAI clients so each test sees its own mock."""
+        _get_sync_client.cache_clear()
 
-        with patch('openai.OpenAI'):
-            provider = get_provider(config)
+    def test_get_openai_provider(self, openai_config):
+        """Test getting OpenAI provider."""
+        with patch.object(openai, 'OpenAI'):
+            provider = get_provider(openai_config)
             assert isinstance(provider, OpenAiProvider)
 
-    def test_get_anthropic_provider(self):
+    def test_get_anthropic_provider(self, anthropic_config):
         """Test getting Anthropic provider."""
-        config = AppConfig(
-            llm=LlmConfig(
-                default_model="claude-3-sonnet",
-                api_keys={"anthropic": "sk-ant-test-key"}
-            ),
-            jira=JiraConfig()
-        )
-
-        with patch('anthropic.Anthropic'):
-            provider = get_provider(config)
+        with patch.object(anthropic, 'Anthropic'):
+            provider = get_provider(anthropic_config)
             assert isinstance(provider, AnthropicProvider)
 
-    def test_get_gemini_provider(self):
+    def test_get_gemini_provider(self, gemini_config):
         """Test getting Gemini provider."""
-        config = AppConfig(
-            llm=LlmConfig(
-                default_model="gemini-1.5-pro",
-                api_keys={"google": "test-google-key"}
-            ),
-            jira=JiraConfig()
-        )
-
-        with patch('google.generativeai.configure'):
-            with patch('google.generativeai.GenerativeModel'):
-                provider = get_provider(config)
+        with patch.object(genai, 'configure'):
+            with patch.object(genai, 'GenerativeModel'):
+                provider = get_provider(gemini_config)
                 assert isinstance(provider, GeminiProvider)
 
     def test_fallback_to_available_provider(self):
@@ -353,19 +407,14 @@ class TestProviderFactory:
             jira=JiraConfig()
         )
 
-        with patch('openai.OpenAI'):
+        with patch.object(openai, 'OpenAI'):
             provider = get_provider(config)
             assert isinstance(provider, OpenAiProvider)
 
-    def test_no_api_keys_error(self):
+    def test_no_api_keys_error(self, no_api_key_config):
         """Test error when no API keys are configured."""
-        config = AppConfig(
-            llm=LlmConfig(default_model="gpt-4o", api_keys={}),
-            jira=JiraConfig()
-        )
-
         with pytest.raises(ApiError, match="No API keys configured"):
-            get_provider(config)
+            get_provider(no_api_key_config)
 
     def test_missing_required_api_key(self):
         """Test error when required API key is missing."""
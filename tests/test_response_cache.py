@@ -0,0 +1,59 @@
+"""Tests for the on-disk LLM response cache."""
+
+import os
+import time
+from unittest.mock import patch
+
+from git_llm_tool.core.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache functionality."""
+
+    def test_make_key_depends_on_every_part(self):
+        """Test that changing any part of the request changes the key."""
+        key = ResponseCache.make_key("OpenAiProvider", "gpt-4o", "prompt")
+
+        assert key == ResponseCache.make_key("OpenAiProvider", "gpt-4o", "prompt")
+        assert key != ResponseCache.make_key("OpenAiProvider", "gpt-4", "prompt")
+        assert key != ResponseCache.make_key("OpenAiProvider", "gpt-4o", "other")
+
+    def test_set_and_get_within_ttl(self, tmp_path):
+        """Test that a stored response is served while it is fresh."""
+        cache = ResponseCache(ttl=3600, cache_dir=tmp_path)
+        key = ResponseCache.make_key("prompt")
+
+        cache.set(key, "feat: cached message")
+
+        assert cache.get(key) == "feat: cached message"
+        assert (tmp_path / key[:2] / f"{key}.txt").read_text(encoding="utf-8") == (
+            "feat: cached message"
+        )
+
+    def test_get_missing_key(self, tmp_path):
+        """Test that an unknown key misses."""
+        cache = ResponseCache(ttl=3600, cache_dir=tmp_path)
+
+        assert cache.get(ResponseCache.make_key("never stored")) is None
+
+    def test_get_expired_entry(self, tmp_path):
+        """Test that an entry older than the TTL misses."""
+        cache = ResponseCache(ttl=60, cache_dir=tmp_path)
+        key = ResponseCache.make_key("prompt")
+        cache.set(key, "stale response")
+
+        stale = time.time() - 120
+        os.utime(tmp_path / key[:2] / f"{key}.txt", (stale, stale))
+
+        assert cache.get(key) is None
+
+    def test_set_ignores_write_errors(self, tmp_path):
+        """Test that a failed write is swallowed without leaving a temp file."""
+        cache = ResponseCache(ttl=3600, cache_dir=tmp_path)
+        key = ResponseCache.make_key("prompt")
+
+        with patch('os.replace', side_effect=OSError("disk full")):
+            cache.set(key, "response")
+
+        assert cache.get(key) is None
+        assert list((tmp_path / key[:2]).iterdir()) == []